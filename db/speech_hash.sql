@@ -0,0 +1,7 @@
+-- =============================================================
+-- Singapore Hansard — speech_hash on hansard_speeches
+-- Content hash of speech_details recorded with each per-speech summary,
+-- so unchanged rows are not summarised again. Run in Supabase SQL Editor.
+-- =============================================================
+
+ALTER TABLE hansard_speeches ADD COLUMN IF NOT EXISTS speech_hash text;
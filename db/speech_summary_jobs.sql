@@ -0,0 +1,16 @@
+-- =============================================================
+-- Singapore Hansard — OpenAI Batch API jobs for per-speech summaries
+-- Only needed when AI_BATCH=true. Run in Supabase SQL Editor.
+-- =============================================================
+
+CREATE TABLE IF NOT EXISTS hansard_speech_summary_jobs (
+  batch_id     text PRIMARY KEY,
+  sitting_date date NOT NULL,
+  status       text NOT NULL,
+  row_count    integer,
+  created_at   timestamptz NOT NULL DEFAULT now(),
+  updated_at   timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_speech_summary_jobs_sitting_date ON hansard_speech_summary_jobs (sitting_date);
+CREATE INDEX IF NOT EXISTS idx_speech_summary_jobs_status ON hansard_speech_summary_jobs (status);
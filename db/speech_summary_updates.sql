@@ -0,0 +1,29 @@
+-- =============================================================
+-- Singapore Hansard — bulk write-back of per-speech summaries
+-- UPDATE-only, so rows deleted by a re-ingest are never re-inserted as
+-- skeletons and NOT NULL speech columns are never checked.
+-- Only needed when AI_ENABLED=true. Run in Supabase SQL Editor.
+-- =============================================================
+
+ALTER TABLE hansard_speeches ADD COLUMN IF NOT EXISTS speech_hash text;
+
+-- p_rows: JSON array of {sitting_date, row_num, <summary columns>}.
+-- speech_hash is only overwritten when the key is present.
+CREATE OR REPLACE FUNCTION hansard_update_speech_summaries(p_rows jsonb)
+RETURNS integer AS $$
+  WITH updated AS (
+    UPDATE hansard_speeches s SET
+      segment_type = u.segment_type,
+      one_liner = u.one_liner,
+      themes = u.themes,
+      key_claims = u.key_claims,
+      summary_version = u.summary_version,
+      summarized_at = u.summarized_at,
+      speech_hash = CASE WHEN e ? 'speech_hash' THEN u.speech_hash ELSE s.speech_hash END
+    FROM jsonb_array_elements(p_rows) e,
+      LATERAL jsonb_populate_record(NULL::hansard_speeches, e) u
+    WHERE s.sitting_date = u.sitting_date AND s.row_num = u.row_num
+    RETURNING 1
+  )
+  SELECT COUNT(*)::integer FROM updated;
+$$ LANGUAGE sql VOLATILE;
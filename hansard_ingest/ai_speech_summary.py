@@ -10,16 +10,21 @@ resume the next day.
 For sitting-level summaries, see :mod:`hansard_ingest.ai_summary`.
 """
 
+import functools
+import hashlib
 import json
 import random
+import re
 import time
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
+from . import llm_cache
 from .config import AI_ENABLED, AI_PROVIDER, OPENAI_API_KEY, OPENAI_MODEL
-from .utils import normalize_ws
+from .http import SESSION
+from .utils import json_loads, normalize_ws
 
 
 SUMMARY_VERSION = "v3"
@@ -72,9 +77,59 @@ JSON_SCHEMA = {
     "required": ["segment_type", "one_liner", "themes", "key_claims"],
 }
 
+# Several rows per request: each result echoes the input ``id`` so it can be
+# mapped back to its row even if the model drops or reorders entries.
+BATCH_JSON_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                **JSON_SCHEMA,
+                "properties": {"id": {"type": "integer"}, **JSON_SCHEMA["properties"]},
+                "required": ["id", *JSON_SCHEMA["required"]],
+            },
+        },
+    },
+    "required": ["results"],
+}
 
-def needs_summary(one_liner: Optional[str], summary_version: Optional[str]) -> bool:
-    return not one_liner or summary_version != SUMMARY_VERSION
+
+def speech_hash(text: Optional[str]) -> str:
+    """Content hash of ``speech_details`` recorded alongside each summary."""
+    return hashlib.blake2b((text or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+def needs_summary(
+    one_liner: Optional[str],
+    summary_version: Optional[str],
+    speech_hash_prev: Optional[str] = None,
+    speech_hash_now: Optional[str] = None,
+) -> bool:
+    if summary_version != SUMMARY_VERSION:
+        return True
+    if speech_hash_prev and speech_hash_now:
+        # Summarised at this version: redo only if the text changed. Procedural
+        # rows have no one_liner, so this is what stops them being redone every run.
+        return speech_hash_prev != speech_hash_now
+    return not one_liner
+
+
+# PostgREST ``or`` filter mirroring ``needs_summary``, so only rows that need
+# work are selected. Keep the two in sync. The server can't hash
+# ``speech_details``, so a row with a recorded ``speech_hash`` is taken as
+# unchanged here; changed text is picked up by scripts/backfill_summaries.py.
+NEEDS_SUMMARY_FILTER = (
+    f"summary_version.is.null,summary_version.neq.{SUMMARY_VERSION},"
+    "and(speech_hash.is.null,or(one_liner.is.null,one_liner.eq.))"
+)
+# The same for databases without db/speech_hash.sql applied: procedural rows
+# (no one_liner) then match on every pass.
+NEEDS_SUMMARY_FILTER_NO_HASH = (
+    f"summary_version.is.null,summary_version.neq.{SUMMARY_VERSION},"
+    "one_liner.is.null,one_liner.eq."
+)
 
 
 def _trim_words(text: str, max_words: int) -> str:
@@ -84,8 +139,8 @@ def _trim_words(text: str, max_words: int) -> str:
     return " ".join(words[:max_words])
 
 
-def _short_summary_from_text(text: str) -> Dict[str, Any]:
-    cleaned = normalize_ws(text or "")
+def _short_summary_from_text(text: str, text_is_clean: bool = False) -> Dict[str, Any]:
+    cleaned = (text or "") if text_is_clean else normalize_ws(text or "")
     if cleaned:
         one_liner = _trim_words(cleaned, 30)
         segment_type = "procedural"
@@ -119,33 +174,68 @@ def build_user_content(text: str, metadata: Dict[str, str]) -> str:
     return "\n".join(lines).strip()
 
 
+def build_batch_user_content(texts: List[str], metadatas: List[Dict[str, str]]) -> str:
+    items = []
+    for i, (text, metadata) in enumerate(zip(texts, metadatas)):
+        metadata = metadata or {}
+        items.append({
+            "id": i,
+            "speaker_name": (metadata.get("speaker_name") or "").strip(),
+            "role": (metadata.get("role") or "").strip(),
+            "sitting_date": (metadata.get("sitting_date") or "").strip(),
+            "text": text or "",
+        })
+    lines = [
+        GUIDANCE_PROMPT.strip(),
+        "Each excerpt below is independent. Return exactly one result per excerpt, "
+        "echoing its id, in the same order.",
+        "Excerpts (JSON array):",
+        json.dumps(items, ensure_ascii=False),
+    ]
+    return "\n".join(lines).strip()
+
+
+_SCHEMA_JSON = json.dumps(JSON_SCHEMA, ensure_ascii=True)
+
+
 def build_fix_prompt(raw_output: str) -> str:
     return (
         "Fix to schema. Output valid JSON only matching the provided schema.\n\n"
-        f"Schema:\n{json.dumps(JSON_SCHEMA, ensure_ascii=True)}\n\n"
+        f"Schema:\n{_SCHEMA_JSON}\n\n"
         f"Invalid output:\n{raw_output}\n"
     )
 
 
-def infer_role_from_label(label: str) -> str:
-    u = normalize_ws(label or "").upper()
-    if not u:
-        return ""
-    if "DEPUTY SPEAKER" in u:
-        return "chair"
-    if "SPEAKER" in u:
-        return "chair"
-    if "CHAIRMAN" in u or "CHAIR" in u:
+# "DEPUTY SPEAKER" and "CHAIRMAN" are covered by the shorter alternatives.
+_CHAIR_ROLE_RE = re.compile(r"SPEAKER|CHAIR", re.I)
+
+
+@functools.lru_cache(maxsize=4096)
+def _role_for_label(label: str) -> str:
+    # Labels repeat across every row a Member speaks in, hence the cache.
+    if label and _CHAIR_ROLE_RE.search(label):
         return "chair"
     return ""
 
 
-def short_circuit_summary(text: str, metadata: Dict[str, str]) -> Optional[Dict[str, Any]]:
-    cleaned = normalize_ws(text or "")
+def infer_role_from_label(label: str) -> str:
+    # Rows from the DB may carry NaN / non-string labels; coerce before the
+    # (hashable, str-only) cached lookup.
+    return _role_for_label(label if isinstance(label, str) else str(label or ""))
+
+
+def short_circuit_summary(
+    text: str, metadata: Dict[str, str], text_is_clean: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Local summary for chair/short rows, or None if the row needs the API.
+
+    Pass ``text_is_clean=True`` when ``text`` already went through ``normalize_ws``.
+    """
+    cleaned = (text or "") if text_is_clean else normalize_ws(text or "")
     if (metadata or {}).get("role") == "chair" and len(cleaned) < 180:
-        return _short_summary_from_text(cleaned)
+        return _short_summary_from_text(cleaned, text_is_clean=True)
     if len(cleaned) < MIN_TEXT_CHARS:
-        return _short_summary_from_text(cleaned)
+        return _short_summary_from_text(cleaned, text_is_clean=True)
     return None
 
 
@@ -161,12 +251,16 @@ def extract_output_text(data: Dict[str, Any]) -> str:
     raise RuntimeError(f"Unexpected OpenAI response: {data}")
 
 
-def _post_with_backoff(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _require_openai() -> None:
     if not OPENAI_API_KEY:
         raise RuntimeError("AI_ENABLED=true but OPENAI_API_KEY is missing")
     if AI_PROVIDER != "openai":
         raise RuntimeError(f"Unsupported AI_PROVIDER: {AI_PROVIDER}")
 
+
+def _post_with_backoff(payload: Dict[str, Any]) -> Dict[str, Any]:
+    _require_openai()
+
     url = "https://api.openai.com/v1/responses"
     headers = {
         "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -176,7 +270,7 @@ def _post_with_backoff(payload: Dict[str, Any]) -> Dict[str, Any]:
     max_attempts = 3
     for attempt in range(max_attempts):
         try:
-            r = requests.post(url, headers=headers, json=payload, timeout=60)
+            r = SESSION.post(url, headers=headers, json=payload, timeout=60)
         except requests.RequestException as e:
             if attempt == max_attempts - 1:
                 raise RuntimeError(f"OpenAI request failed: {e}")
@@ -202,27 +296,37 @@ def _post_with_backoff(payload: Dict[str, Any]) -> Dict[str, Any]:
         if not r.ok:
             raise RuntimeError(f"OpenAI API error {r.status_code}: {r.text}")
 
-        return r.json()
+        return json_loads(r.content)
 
     raise RuntimeError("OpenAI request failed after retries")
 
 
-def build_responses_payload(user_content: str) -> Dict[str, Any]:
-    return {
-        "model": OPENAI_MODEL,
-        "input": [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_content},
-        ],
-        "temperature": 0.2,
-        "text": {
+# Parts of the request body that never change between calls. They are shared
+# by reference across payloads, which are only ever serialised, not mutated.
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_TEXT_FORMATS: Dict[str, Dict[str, Any]] = {}
+
+
+def build_responses_payload(
+    user_content: str,
+    schema: Dict[str, Any] = JSON_SCHEMA,
+    schema_name: str = "hansard_speech_summary",
+) -> Dict[str, Any]:
+    text_format = _TEXT_FORMATS.get(schema_name)
+    if text_format is None:
+        text_format = _TEXT_FORMATS[schema_name] = {
             "format": {
                 "type": "json_schema",
-                "name": "hansard_speech_summary",
-                "schema": JSON_SCHEMA,
+                "name": schema_name,
+                "schema": schema,
                 "strict": True,
             }
-        },
+        }
+    return {
+        "model": OPENAI_MODEL,
+        "input": [_SYSTEM_MESSAGE, {"role": "user", "content": user_content}],
+        "temperature": 0.2,
+        "text": text_format,
     }
 
 
@@ -232,6 +336,10 @@ def _call_responses_api(user_content: str) -> str:
     return extract_output_text(data)
 
 
+def _cache_key(user_content: str) -> str:
+    return llm_cache.cache_key(OPENAI_MODEL, SUMMARY_VERSION, SYSTEM_PROMPT, user_content)
+
+
 def _validate_payload(obj: Any) -> Optional[Dict[str, Any]]:
     if not isinstance(obj, dict):
         return None
@@ -293,15 +401,19 @@ def parse_summary_output(raw_output: str) -> Optional[Dict[str, Any]]:
     if not raw_output or not str(raw_output).strip():
         return None
     try:
-        parsed = json.loads(raw_output)
+        parsed = json_loads(raw_output)
     except json.JSONDecodeError:
         return None
     return _validate_payload(parsed)
 
 
-def repair_summary_output(raw_output: str, text: str, metadata: Dict[str, str]) -> Optional[Dict[str, Any]]:
+def repair_summary_output(
+    raw_output: str, text: str, metadata: Dict[str, str], user_content: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     fix_prompt = build_fix_prompt(raw_output)
-    retry_user = f"{fix_prompt}\n\n{build_user_content(text, metadata)}"
+    if user_content is None:
+        user_content = build_user_content(text, metadata)
+    retry_user = f"{fix_prompt}\n\n{user_content}"
     raw_retry = _call_responses_api(retry_user)
     return parse_summary_output(raw_retry)
 
@@ -311,34 +423,241 @@ def summarize_row(text: str, metadata: Dict[str, str]) -> Optional[Dict[str, Any
         return None
 
     cleaned = normalize_ws(text or "")
-    short_circuit = short_circuit_summary(cleaned, metadata or {})
+    short_circuit = short_circuit_summary(cleaned, metadata or {}, text_is_clean=True)
     if short_circuit:
         return short_circuit
 
     user_content = build_user_content(cleaned, metadata or {})
+    key = _cache_key(user_content) if llm_cache.enabled() else ""
+    if key:
+        cached = llm_cache.get(key)
+        if cached:
+            return cached
+
     raw = _call_responses_api(user_content)
     validated = parse_summary_output(raw)
-    if validated:
-        return validated
+    if not validated:
+        validated = repair_summary_output(raw, cleaned, metadata or {}, user_content)
+    if validated and key:
+        llm_cache.set(key, validated)
+    return validated
+
+
+def summarize_rows_batch(texts: List[str], metadatas: List[Dict[str, str]]) -> List[Optional[Dict[str, Any]]]:
+    """Summarize several rows in one Responses API call.
+
+    Returns one entry per input, aligned by position. Entries the model
+    dropped or returned invalid are ``None`` so the caller can fall back to
+    :func:`summarize_row`. Rows are sent as-is: run ``short_circuit_summary``
+    first, since short/procedural rows never need the API.
+
+    With the cache on, rows already cached from single-row calls are reused;
+    the batch response itself is cached under the batch prompt, since the
+    other excerpts in a request shape each result.
+    """
+    if not AI_ENABLED or not texts:
+        return [None] * len(texts)
+
+    cleaned = [normalize_ws(t or "") for t in texts]
+    metadatas = [m or {} for m in metadatas]
+    out: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+
+    misses = list(range(len(texts)))
+    if llm_cache.enabled():
+        for i in misses:
+            out[i] = llm_cache.get(_cache_key(build_user_content(cleaned[i], metadatas[i])))
+        misses = [i for i in misses if out[i] is None]
+        if not misses:
+            return out
+
+    user_content = build_batch_user_content([cleaned[i] for i in misses], [metadatas[i] for i in misses])
+    batch_key = (
+        llm_cache.cache_key(OPENAI_MODEL, SUMMARY_VERSION, SYSTEM_PROMPT, "hansard_speech_summary_batch", user_content)
+        if llm_cache.enabled()
+        else ""
+    )
+    if batch_key:
+        cached = llm_cache.get(batch_key)
+        results = cached.get("results") if cached else None
+        if isinstance(results, list) and len(results) == len(misses):
+            for i, summary in zip(misses, results):
+                out[i] = summary
+            return out
+
+    payload = build_responses_payload(user_content, BATCH_JSON_SCHEMA, "hansard_speech_summary_batch")
+    raw = extract_output_text(_post_with_backoff(payload))
+
+    try:
+        parsed = json_loads(raw)
+    except json.JSONDecodeError:
+        return out
+    results = parsed.get("results") if isinstance(parsed, dict) else None
+    if not isinstance(results, list):
+        return out
+
+    for item in results:
+        if not isinstance(item, dict):
+            continue
+        idx = item.get("id")
+        if not isinstance(idx, int) or not 0 <= idx < len(misses) or out[misses[idx]] is not None:
+            continue
+        out[misses[idx]] = _validate_payload(item)
+    if batch_key and any(out[i] for i in misses):
+        llm_cache.set(batch_key, {"results": [out[i] for i in misses]})
+    return out
+
 
-    return repair_summary_output(raw, cleaned, metadata or {})
+# ---------- OpenAI Batch API (AI_BATCH=true) ----------
+# Rows are submitted as one 24h batch job per sitting at half the on-demand
+# price; ``hansard_ingest.reap_summary_batches`` collects the results later.
 
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def batch_custom_id(sitting_iso: str, row_num: int, text_hash: str) -> str:
+    # The row's speech_hash rides along so the reaper can record it
+    return f"{sitting_iso}:{row_num}:{text_hash}"
+
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def parse_batch_custom_id(custom_id: str) -> Optional[Tuple[str, int, Optional[str]]]:
+    """``(sitting_iso, row_num, text_hash)`` from a ``batch_custom_id``, or None if malformed.
+
+    Jobs submitted before the hash was added have ``sitting:row`` ids; their
+    ``text_hash`` is None.
+    """
+    parts = str(custom_id or "").split(":")
+    if len(parts) not in (2, 3) or not _ISO_DATE_RE.fullmatch(parts[0]):
+        return None
+    try:
+        date.fromisoformat(parts[0])
+        row_num = int(parts[1])
+    except ValueError:
+        return None
+    return parts[0], row_num, (parts[2] or None) if len(parts) == 3 else None
 
-def build_summary_update(payload: Dict[str, Any]) -> Dict[str, Any]:
+
+def submit_speech_batch(sitting_iso: str, rows: List[Tuple[int, str, Dict[str, str]]]) -> str:
+    """Submit ``(row_num, text, metadata)`` rows as one Batch API job; return the batch id.
+
+    ``text`` is the row's raw ``speech_details`` (its ``speech_hash`` goes in
+    the custom_id). Rows should already have passed ``short_circuit_summary``.
+    """
+    _require_openai()
+    lines = []
+    for row_num, text, metadata in rows:
+        user_content = build_user_content(normalize_ws(text or ""), metadata or {})
+        lines.append(json.dumps({
+            "custom_id": batch_custom_id(sitting_iso, row_num, speech_hash(text)),
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": build_responses_payload(user_content),
+        }, ensure_ascii=False))
+    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+
+    r = SESSION.post(
+        "https://api.openai.com/v1/files",
+        headers=headers,
+        data={"purpose": "batch"},
+        files={"file": (f"speeches_{sitting_iso}.jsonl", "\n".join(lines).encode("utf-8"), "application/jsonl")},
+        timeout=120,
+    )
+    if not r.ok:
+        raise RuntimeError(f"OpenAI file upload error {r.status_code}: {r.text}")
+    file_id = r.json()["id"]
+
+    r = SESSION.post(
+        "https://api.openai.com/v1/batches",
+        headers=headers,
+        json={
+            "input_file_id": file_id,
+            "endpoint": "/v1/responses",
+            "completion_window": "24h",
+            "metadata": {"sitting_date": sitting_iso, "summary_version": SUMMARY_VERSION},
+        },
+        timeout=60,
+    )
+    if not r.ok:
+        raise RuntimeError(f"OpenAI batch create error {r.status_code}: {r.text}")
+    return r.json()["id"]
+
+
+def get_batch(batch_id: str) -> Dict[str, Any]:
+    _require_openai()
+    r = SESSION.get(
+        f"https://api.openai.com/v1/batches/{batch_id}",
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+        timeout=60,
+    )
+    if not r.ok:
+        raise RuntimeError(f"OpenAI batch status error {r.status_code}: {r.text}")
+    return r.json()
+
+
+def iter_batch_results(output_file_id: str) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Yield ``(custom_id, validated_summary_or_None)`` for each line of a batch output file."""
+    _require_openai()
+    r = SESSION.get(
+        f"https://api.openai.com/v1/files/{output_file_id}/content",
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+        timeout=300,
+    )
+    if not r.ok:
+        raise RuntimeError(f"OpenAI batch output error {r.status_code}: {r.text}")
+
+    for line in r.text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            rec = json_loads(line)
+        except json.JSONDecodeError:
+            continue
+        response = rec.get("response") or {}
+        summary = None
+        if response.get("status_code") == 200:
+            try:
+                summary = parse_summary_output(extract_output_text(response.get("body") or {}))
+            except RuntimeError:
+                summary = None
+        yield rec.get("custom_id") or "", summary
+
+
+def build_summary_update(
+    payload: Dict[str, Any],
+    text: Optional[str] = None,
+    now_iso: Optional[str] = None,
+    text_hash: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Columns to write back onto ``hansard_speeches``.
+
+    Pass the row's raw ``speech_details`` as ``text`` (or its hash as
+    ``text_hash``) to record its ``speech_hash``, so unchanged rows are not
+    summarised again. Callers writing many rows pass one ``now_iso`` for the
+    whole pass.
+    """
+    now_iso = now_iso or datetime.utcnow().isoformat()
     if payload.get("segment_type") == "procedural":
-        return {
+        update = {
             "segment_type": payload["segment_type"],
             "one_liner": None,
             "themes": [],
             "key_claims": [],
             "summary_version": SUMMARY_VERSION,
-            "summarized_at": datetime.utcnow().isoformat(),
+            "summarized_at": now_iso,
         }
-    return {
-        "segment_type": payload["segment_type"],
-        "one_liner": payload["one_liner"],
-        "themes": payload["themes"],
-        "key_claims": payload["key_claims"],
-        "summary_version": SUMMARY_VERSION,
-        "summarized_at": datetime.utcnow().isoformat(),
-    }
+    else:
+        update = {
+            "segment_type": payload["segment_type"],
+            "one_liner": payload["one_liner"],
+            "themes": payload["themes"],
+            "key_claims": payload["key_claims"],
+            "summary_version": SUMMARY_VERSION,
+            "summarized_at": now_iso,
+        }
+    if text is not None:
+        update["speech_hash"] = speech_hash(text)
+    elif text_hash:
+        update["speech_hash"] = text_hash
+    return update
@@ -12,7 +12,6 @@ from datetime import datetime
 from typing import Optional
 
 import pandas as pd
-import requests
 
 from .config import (
     AI_ENABLED,
@@ -21,6 +20,14 @@ from .config import (
     OPENAI_API_KEY,
     OPENAI_MODEL,
 )
+from .http import SESSION
+from .utils import json_loads
+
+
+def _text_col(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str)
 
 
 def build_ai_summary_prompt(sitting_date_iso: str, speech_df: pd.DataFrame) -> str:
@@ -48,21 +55,26 @@ def build_ai_summary_prompt(sitting_date_iso: str, speech_df: pd.DataFrame) -> s
                 "3) Why we should care\n"
             )
 
-    # Keep only substantive fields; concatenate in order
-    parts = []
-    for _, r in speech_df.sort_values(["row_num"]).iterrows():
-        speaker = str(r.get("mp_name_fuzzy_matched") or r.get("mp_name_raw") or "").strip()
-        speech = str(r.get("speech_details") or "").strip()
-        if not speech:
-            continue
-        # Keep it readable but compact
-        parts.append(f"{speaker}: {speech}")
-
-    raw_text = "\n".join(parts)
-
-    # Hard cap to avoid runaway prompt sizes
-    if AI_MAX_CHARS and AI_MAX_CHARS > 0 and len(raw_text) > AI_MAX_CHARS:
-        raw_text = raw_text[:AI_MAX_CHARS] + "\n...[truncated]"
+    # Keep only substantive fields; concatenate in order. parse_one_sitting
+    # already emits rows in row_num order, so only sort frames that aren't.
+    df = speech_df
+    if not df["row_num"].is_monotonic_increasing:
+        df = df.sort_values("row_num", kind="stable")
+    speaker = _text_col(df, "mp_name_fuzzy_matched")
+    speaker = speaker.where(speaker != "", _text_col(df, "mp_name_raw")).str.strip()
+    speech = _text_col(df, "speech_details").str.strip()
+    parts = (speaker + ": " + speech)[speech != ""]
+
+    # Hard cap to avoid runaway prompt sizes: only join the parts that reach
+    # the cap (each part is followed by a newline in the joined text).
+    if AI_MAX_CHARS and AI_MAX_CHARS > 0 and len(parts):
+        ends = (parts.str.len() + 1).cumsum().to_numpy() - 1
+        n_keep = int(ends.searchsorted(AI_MAX_CHARS, side="left")) + 1
+        raw_text = "\n".join(parts.iloc[:n_keep])
+        if ends[-1] > AI_MAX_CHARS:
+            raw_text = raw_text[:AI_MAX_CHARS] + "\n...[truncated]"
+    else:
+        raw_text = "\n".join(parts)
 
     return (
         "You are summarizing a Singapore Parliament sitting transcript.\n"
@@ -93,7 +105,7 @@ def openai_summarize(prompt: str) -> str:
         "temperature": 0.5,
     }
 
-    r = requests.post(
+    r = SESSION.post(
         url,
         headers={
             "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -106,7 +118,7 @@ def openai_summarize(prompt: str) -> str:
     if not r.ok:
         raise RuntimeError(f"OpenAI API error {r.status_code}: {r.text}")
 
-    data = r.json()
+    data = json_loads(r.content)
     try:
         return data["choices"][0]["message"]["content"].strip()
     except Exception:
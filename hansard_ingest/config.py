@@ -46,9 +46,20 @@ END_DATE_ISO = env_str("END_DATE", "")
 # Optional safety cap per run (good for GitHub Actions). Set to 0 to disable.
 MAX_DAYS_PER_RUN = env_int("MAX_DAYS_PER_RUN", 0)
 
+# Sitting-day fetches in flight ahead of the parse/upsert loop. 1 fetches one day at a time.
+FETCH_CONCURRENCY = env_int("FETCH_CONCURRENCY", 4)
+# Sitting days parsed + upserted at once. 1 keeps strict date order, so an
+# interrupted run never leaves a gap before the latest stored sitting.
+INGEST_WORKERS = env_int("INGEST_WORKERS", 1)
+# Directory of raw API responses reused across runs (handy for re-parse/debug
+# loops). Only sittings with content are cached; empty days are re-fetched.
+FETCH_CACHE_DIR = env_str("FETCH_CACHE_DIR", "")
+
 # Supabase
 SUPABASE_URL = env_str("SUPABASE_URL", "")
 SUPABASE_SERVICE_ROLE_KEY = env_str("SUPABASE_SERVICE_ROLE_KEY", "")
+# Upsert batches in flight per table when writing a sitting. 1 sends them one at a time.
+UPSERT_CONCURRENCY = env_int("UPSERT_CONCURRENCY", 4)
 
 # If true, parse + write CSV/JSON locally but do NOT talk to Supabase
 SKIP_DB = env_bool("SKIP_DB", False)
@@ -63,3 +74,13 @@ OPENAI_API_KEY = env_str("OPENAI_API_KEY", "")
 OPENAI_MODEL = env_str("OPENAI_MODEL", "gpt-4o-mini")
 AI_MAX_CHARS = env_int("AI_MAX_CHARS", 12000)
 AI_DRY_RUN = env_bool("AI_DRY_RUN", False)  # if true, generate summary but don't write to DB
+# Speech rows packed into one Responses API call for per-speech summaries. Opt-in:
+# the multi-excerpt prompt gives different outputs than the default one-row prompt.
+AI_SUMMARY_BATCH_SIZE = env_int("AI_SUMMARY_BATCH_SIZE", 1)
+# Concurrent per-speech summary requests in flight per sitting (keep under the OpenAI RPM limit).
+AI_MAX_CONCURRENCY = env_int("AI_MAX_CONCURRENCY", 8)
+# SQLite file caching validated per-speech summaries by prompt hash. Empty disables the cache.
+AI_CACHE_PATH = env_str("AI_CACHE_PATH", "")
+# Submit per-speech summaries to the OpenAI Batch API (24h, half price) instead of calling on demand.
+# Results are written by `python -m hansard_ingest.reap_summary_batches`.
+AI_BATCH = env_bool("AI_BATCH", False)
@@ -7,26 +7,43 @@ columns and drop in-payload duplicates before upserting to avoid the
 Postgres error that fires when one statement carries duplicate keys.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
 import pandas as pd
 
 from .config import (
     AI_DRY_RUN,
+    AI_BATCH,
     AI_ENABLED,
+    AI_MAX_CONCURRENCY,
+    AI_SUMMARY_BATCH_SIZE,
     DEBUG,
     SKIP_DB,
     SUPABASE_SERVICE_ROLE_KEY,
     SUPABASE_URL,
+    UPSERT_CONCURRENCY,
 )
 from .ai_speech_summary import (
+    BATCH_TERMINAL_STATUSES,
+    NEEDS_SUMMARY_FILTER,
+    NEEDS_SUMMARY_FILTER_NO_HASH,
     build_summary_update,
     infer_role_from_label,
-    needs_summary,
+    short_circuit_summary,
     summarize_row,
+    summarize_rows_batch,
+    submit_speech_batch,
+)
+from .utils import (
+    chunk_records,
+    iter_json_record_batches,
+    normalize_df_pk_cols,
+    normalize_ws,
+    scrub_records_for_json,
 )
-from .utils import chunk_records, normalize_df_pk_cols, scrub_records_for_json
 
 # Supabase is optional for local parsing runs (e.g., SKIP_DB=true).
 # We import it lazily so the script can run even if the package isn't installed.
@@ -65,58 +82,317 @@ def get_latest_sitting(sb: Client) -> Optional[date]:
     return None
 
 
-def summarize_speeches_for_date(sb: Client, sitting_iso: str) -> None:
-    if not AI_ENABLED or AI_DRY_RUN:
-        return
+_speech_hash_lock = threading.Lock()
+_speech_hash_available: Optional[bool] = None
+
+
+def speech_hash_column_available(sb: Client) -> bool:
+    """Whether ``hansard_speeches.speech_hash`` exists (db/speech_hash.sql applied).
+
+    Probed once per process. Without the column, summary selects and writes
+    leave it out instead of failing every pass.
+    """
+    global _speech_hash_available
+    with _speech_hash_lock:
+        if _speech_hash_available is None:
+            try:
+                sb.table("hansard_speeches").select("speech_hash").limit(1).execute()
+                _speech_hash_available = True
+            except Exception as e:
+                if "speech_hash" not in str(e):
+                    raise
+                print(
+                    "hansard_speeches.speech_hash is missing; apply db/speech_hash.sql. "
+                    "Until then procedural rows are re-summarised on every pass."
+                )
+                _speech_hash_available = False
+        return _speech_hash_available
 
+
+SUMMARY_UPDATE_BATCH_SIZE = 200
+SUMMARY_UPDATE_RPC = "hansard_update_speech_summaries"
+
+_summary_rpc_lock = threading.Lock()
+_summary_rpc_available: Optional[bool] = None
+
+
+def summary_update_rpc_available(sb: Client) -> bool:
+    """Whether the bulk summary RPC exists (db/speech_summary_updates.sql applied).
+
+    Probed once per process with an empty batch. Without it, summary columns
+    are written with one ``update`` per row.
+    """
+    global _summary_rpc_available
+    with _summary_rpc_lock:
+        if _summary_rpc_available is None:
+            try:
+                sb.rpc(SUMMARY_UPDATE_RPC, {"p_rows": []}).execute()
+                _summary_rpc_available = True
+            except Exception as e:
+                if SUMMARY_UPDATE_RPC not in str(e):
+                    raise
+                print(
+                    f"{SUMMARY_UPDATE_RPC} is missing; apply db/speech_summary_updates.sql. "
+                    "Until then speech summaries are written one row at a time."
+                )
+                _summary_rpc_available = False
+        return _summary_rpc_available
+
+
+def write_summary_updates(sb: Client, updates: list, label: str) -> None:
+    """Write per-speech summary columns onto existing ``hansard_speeches`` rows.
+
+    Each update carries ``sitting_date`` + ``row_num`` plus the
+    ``build_summary_update`` fields. Batches go through the
+    ``hansard_update_speech_summaries`` RPC, a plain UPDATE, so rows deleted
+    since they were read stay deleted. If the RPC is missing or rejects a
+    batch, that batch falls back to one ``update`` per row so a single bad
+    row cannot drop the rest.
+    """
+    if updates and not speech_hash_column_available(sb):
+        updates = [{k: v for k, v in u.items() if k != "speech_hash"} for u in updates]
+    use_rpc = bool(updates) and summary_update_rpc_available(sb)
+    for batch in chunk_records(updates, SUMMARY_UPDATE_BATCH_SIZE):
+        if use_rpc:
+            try:
+                sb.rpc(SUMMARY_UPDATE_RPC, {"p_rows": batch}).execute()
+                continue
+            except Exception as e:
+                if DEBUG:
+                    print(f"[DEBUG] Batched speech summary update failed for {label}; retrying per row: {e}")
+
+        for u in batch:
+            fields = {k: v for k, v in u.items() if k not in ("sitting_date", "row_num")}
+            try:
+                (
+                    sb.table("hansard_speeches")
+                    .update(fields)
+                    .eq("sitting_date", u["sitting_date"])
+                    .eq("row_num", u["row_num"])
+                    .execute()
+                )
+            except Exception as e:
+                print(f"Speech summary update failed for {u['sitting_date']} row {u['row_num']}: {e}")
+
+
+def _submit_summary_batch(sb: Client, sitting_iso: str, pending: list) -> None:
+    """Hand rows to the OpenAI Batch API and record the job in hansard_speech_summary_jobs."""
+    if not pending:
+        return
     try:
         resp = (
-            sb.table("hansard_speeches")
-            .select(
-                "sitting_date,row_num,speech_details,mp_name_fuzzy_matched,mp_name_raw,dim_speaker,summary_version,one_liner"
-            )
+            sb.table("hansard_speech_summary_jobs")
+            .select("batch_id,status")
             .eq("sitting_date", sitting_iso)
-            .order("row_num")
             .execute()
         )
     except Exception as e:
-        print(f"Speech summary select failed for {sitting_iso}: {e}")
+        print(f"Speech summary job lookup failed for {sitting_iso}: {e}")
+        return
+    if any((j.get("status") or "") not in BATCH_TERMINAL_STATUSES for j in resp.data or []):
+        # Rows still look unsummarised until the open job is reaped; don't submit them twice.
+        if DEBUG:
+            print(f"[DEBUG] Speech summary batch already pending for {sitting_iso}; skipping submit")
         return
 
-    rows = resp.data or []
-    for row in rows:
-        if not needs_summary(row.get("one_liner"), row.get("summary_version")):
-            continue
-        if not row.get("sitting_date") or row.get("row_num") is None:
-            continue
-        speech = str(row.get("speech_details") or "")
-        speaker_label = row.get("mp_name_raw") or ""
-        metadata = {
-            "speaker_name": speaker_label,
-            "role": infer_role_from_label(speaker_label),
-            "sitting_date": row.get("sitting_date") or sitting_iso,
-        }
+    try:
+        batch_id = submit_speech_batch(
+            sitting_iso,
+            [(row["row_num"], str(row.get("speech_details") or ""), metadata) for row, _speech, metadata in pending],
+        )
+    except Exception as e:
+        print(f"Speech summary batch submit failed for {sitting_iso}: {e}")
+        return
+
+    now = datetime.utcnow().isoformat()
+    try:
+        sb.table("hansard_speech_summary_jobs").upsert(
+            {
+                "batch_id": batch_id,
+                "sitting_date": sitting_iso,
+                "status": "submitted",
+                "row_count": len(pending),
+                "created_at": now,
+                "updated_at": now,
+            },
+            on_conflict="batch_id",
+        ).execute()
+    except Exception as e:
+        print(f"Speech summary job insert failed for {sitting_iso} (batch {batch_id}): {e}")
+        return
+    print(f"Submitted speech summary batch {batch_id} for {sitting_iso}: {len(pending)} rows")
 
-        try:
-            summary = summarize_row(speech, metadata)
-        except Exception as e:
-            print(f"Speech summary failed for {sitting_iso} row {row.get('row_num')}: {e}")
-            continue
 
-        if not summary:
-            continue
+SUMMARY_SELECT_PAGE_SIZE = 1000
 
-        update = build_summary_update(summary)
+
+def _iter_summary_candidate_pages(sb: Client, sitting_iso: str):
+    """Yield pages of rows that still need a summary, filtered server-side.
+
+    Pages are keyed on ``row_num`` rather than offsets: summarised rows
+    drop out of the filter as we go, which would make offsets skip rows.
+    """
+    needs_filter = NEEDS_SUMMARY_FILTER if speech_hash_column_available(sb) else NEEDS_SUMMARY_FILTER_NO_HASH
+    last_row_num = None
+    while True:
+        q = (
+            sb.table("hansard_speeches")
+            .select("sitting_date,row_num,speech_details,mp_name_raw")
+            .eq("sitting_date", sitting_iso)
+            .or_(needs_filter)
+        )
+        if last_row_num is not None:
+            q = q.gt("row_num", last_row_num)
+        rows = q.order("row_num").limit(SUMMARY_SELECT_PAGE_SIZE).execute().data or []
+        if not rows:
+            return
+        yield rows
+        if len(rows) < SUMMARY_SELECT_PAGE_SIZE:
+            return
+        last_row_num = rows[-1]["row_num"]
+
+
+def summarize_speeches_for_date(sb: Client, sitting_iso: str) -> None:
+    if not AI_ENABLED or AI_DRY_RUN:
+        return
+
+    updates: list = []
+    now_iso = datetime.utcnow().isoformat()
+
+    def _write_summary(row: dict, summary: dict) -> None:
+        updates.append({
+            "sitting_date": row["sitting_date"],
+            "row_num": row["row_num"],
+            **build_summary_update(summary, text=str(row.get("speech_details") or ""), now_iso=now_iso),
+        })
+        if len(updates) >= SUMMARY_UPDATE_BATCH_SIZE:
+            write_summary_updates(sb, updates, sitting_iso)
+            updates.clear()
+
+    batch_size = max(1, AI_SUMMARY_BATCH_SIZE)
+    daily_limit = threading.Event()
+
+    def _summarize_batch(batch: list) -> list:
+        if daily_limit.is_set():
+            return []
+        summaries = [None] * len(batch)
+        if batch_size > 1:
+            try:
+                summaries = summarize_rows_batch([b[1] for b in batch], [b[2] for b in batch])
+            except Exception as e:
+                print(f"Speech summary batch failed for {sitting_iso} rows {batch[0][0].get('row_num')}-{batch[-1][0].get('row_num')}: {e}")
+                if "DAILY_LIMIT_REACHED" in str(e):
+                    daily_limit.set()
+                    return []
+
+        out = []
+        for (row, speech, metadata), summary in zip(batch, summaries):
+            if not summary:
+                # Not batched, or dropped/invalid in the batch response: fall back to one call per row
+                if daily_limit.is_set():
+                    break
+                try:
+                    summary = summarize_row(speech, metadata)
+                except Exception as e:
+                    print(f"Speech summary failed for {sitting_iso} row {row.get('row_num')}: {e}")
+                    if "DAILY_LIMIT_REACHED" in str(e):
+                        daily_limit.set()
+                    continue
+            if summary:
+                out.append((row, summary))
+        return out
+
+    batch_pending = []
+    # API calls are network-bound, so overlap up to AI_MAX_CONCURRENCY of them;
+    # DB updates stay on this thread as each batch completes.
+    with ThreadPoolExecutor(max_workers=max(1, AI_MAX_CONCURRENCY)) as executor:
         try:
-            (
-                sb.table("hansard_speeches")
-                .update(update)
-                .eq("sitting_date", row["sitting_date"])
-                .eq("row_num", row["row_num"])
-                .execute()
-            )
+            for rows in _iter_summary_candidate_pages(sb, sitting_iso):
+                # Short/procedural rows are summarised locally; the rest are sent to the API
+                # in batches of AI_SUMMARY_BATCH_SIZE rows per request.
+                pending = []
+                # A sitting has far fewer speakers than rows: classify each label once.
+                role_map = {label: infer_role_from_label(label) for label in {row.get("mp_name_raw") or "" for row in rows}}
+                for row in rows:
+                    if not row.get("sitting_date") or row.get("row_num") is None:
+                        continue
+                    speech = normalize_ws(row.get("speech_details") or "")
+                    speaker_label = row.get("mp_name_raw") or ""
+                    metadata = {
+                        "speaker_name": speaker_label,
+                        "role": role_map[speaker_label],
+                        "sitting_date": row.get("sitting_date") or sitting_iso,
+                    }
+
+                    short = short_circuit_summary(speech, metadata, text_is_clean=True)
+                    if short:
+                        _write_summary(row, short)
+                    else:
+                        pending.append((row, speech, metadata))
+
+                if AI_BATCH:
+                    batch_pending.extend(pending)
+                    continue
+
+                futures = [executor.submit(_summarize_batch, batch) for batch in chunk_records(pending, batch_size)]
+                for future in as_completed(futures):
+                    for row, summary in future.result():
+                        _write_summary(row, summary)
+                if daily_limit.is_set():
+                    break
         except Exception as e:
-            print(f"Speech summary update failed for {sitting_iso} row {row.get('row_num')}: {e}")
+            print(f"Speech summary select failed for {sitting_iso}: {e}")
+
+    write_summary_updates(sb, updates, sitting_iso)
+    if AI_BATCH:
+        _submit_summary_batch(sb, sitting_iso, batch_pending)
+
+
+def _upsert_batches(sb: Client, table: str, batches, on_conflict: str) -> None:
+    """Upsert record batches, up to UPSERT_CONCURRENCY requests in flight.
+
+    Batches come from one de-duplicated frame, so their PKs are disjoint and
+    order doesn't matter. At most UPSERT_CONCURRENCY batches are materialised
+    at once. The first failure is re-raised after the rest have finished.
+    """
+    workers = max(1, UPSERT_CONCURRENCY)
+    if workers == 1:
+        for batch in batches:
+            sb.table(table).upsert(batch, on_conflict=on_conflict).execute()
+        return
+
+    def _send(batch):
+        sb.table(table).upsert(batch, on_conflict=on_conflict).execute()
+
+    slots = threading.BoundedSemaphore(workers)
+    futures = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch in batches:
+            slots.acquire()
+            future = executor.submit(_send, batch)
+            future.add_done_callback(lambda _f: slots.release())
+            futures.append(future)
+    for future in futures:
+        future.result()
+
+
+def _dedupe_on_pk(df: pd.DataFrame, pk: List[str], normalize: List[str], label: str) -> pd.DataFrame:
+    """Normalize ``normalize`` columns in place, then keep the first row per ``pk``.
+
+    One ``duplicated`` pass gives the keep mask; the DEBUG report of every
+    duplicated key only runs when that pass found any.
+    """
+    if df is None or df.empty or not set(pk).issubset(df.columns):
+        return df
+    df = normalize_df_pk_cols(df, normalize, inplace=True)
+    keep_mask = ~df.duplicated(subset=pk, keep="first")
+    if keep_mask.all():
+        return df
+    if DEBUG:
+        dup_mask = df.duplicated(subset=pk, keep=False)
+        print(f"[DEBUG] Duplicate {label} PK rows BEFORE de-dup:")
+        print(df.loc[dup_mask, pk].value_counts().head(50))
+    return df.loc[keep_mask]
 
 
 def upsert_all(
@@ -135,65 +411,38 @@ def upsert_all(
     This usually means our parsed payload contains duplicates for the table's PK.
 
     We therefore:
-      1) normalize PK fields (strip whitespace; stable string conversion)
+      1) normalize PK fields (strip whitespace; stable string conversion), in place
+         on the passed frames, which callers discard after the upsert
       2) drop duplicates on the real PK
       3) upsert in batches with explicit on_conflict targets
     """
 
     # Attendance PK: (sitting_date, mp_name_raw)
-    df_att_u = df_att
-    if df_att_u is not None and not df_att_u.empty and {"sitting_date", "mp_name_raw"}.issubset(df_att_u.columns):
-        df_att_u = normalize_df_pk_cols(df_att_u, ["sitting_date", "mp_name_raw"])
-        if DEBUG:
-            dup_mask = df_att_u.duplicated(subset=["sitting_date", "mp_name_raw"], keep=False)
-            if dup_mask.any():
-                print("[DEBUG] Duplicate attendance PK rows BEFORE de-dup:")
-                print(df_att_u.loc[dup_mask, ["sitting_date", "mp_name_raw"]].value_counts().head(50))
-        df_att_u = df_att_u.drop_duplicates(subset=["sitting_date", "mp_name_raw"], keep="first")
+    att_pk = ["sitting_date", "mp_name_raw"]
+    df_att_u = _dedupe_on_pk(df_att, att_pk, att_pk, "attendance")
 
     # PTBA PK: (sitting_date, mp_name_raw, ptba_from, ptba_to)
-    df_ptba_u = df_ptba
-    if df_ptba_u is not None and not df_ptba_u.empty and {"sitting_date", "mp_name_raw", "ptba_from", "ptba_to"}.issubset(df_ptba_u.columns):
-        df_ptba_u = normalize_df_pk_cols(df_ptba_u, ["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"])
-        if DEBUG:
-            dup_mask = df_ptba_u.duplicated(subset=["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"], keep=False)
-            if dup_mask.any():
-                print("[DEBUG] Duplicate PTBA PK rows BEFORE de-dup:")
-                print(df_ptba_u.loc[dup_mask, ["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"]].value_counts().head(50))
-        df_ptba_u = df_ptba_u.drop_duplicates(subset=["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"], keep="first")
+    ptba_pk = ["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"]
+    df_ptba_u = _dedupe_on_pk(df_ptba, ptba_pk, ptba_pk, "PTBA")
 
     # Speeches PK: (sitting_date, row_num)
-    df_speech_u = df_speech
-    if df_speech_u is not None and not df_speech_u.empty and {"sitting_date", "row_num"}.issubset(df_speech_u.columns):
-        df_speech_u = normalize_df_pk_cols(df_speech_u, ["sitting_date"])
-        if DEBUG:
-            dup_mask = df_speech_u.duplicated(subset=["sitting_date", "row_num"], keep=False)
-            if dup_mask.any():
-                print("[DEBUG] Duplicate speeches PK rows BEFORE de-dup:")
-                print(df_speech_u.loc[dup_mask, ["sitting_date", "row_num"]].value_counts().head(50))
-        df_speech_u = df_speech_u.drop_duplicates(subset=["sitting_date", "row_num"], keep="first")
-
-    def _json_records(df: pd.DataFrame):
-        if df is None or df.empty:
-            return []
-        return scrub_records_for_json(df.to_dict("records"))
+    df_speech_u = _dedupe_on_pk(df_speech, ["sitting_date", "row_num"], ["sitting_date"], "speeches")
 
     # Upsert batches with explicit conflict targets
     try:
-        for batch in chunk_records(_json_records(df_att_u), 500):
-            sb.table("hansard_attendance").upsert(batch, on_conflict="sitting_date,mp_name_raw").execute()
+        _upsert_batches(sb, "hansard_attendance", iter_json_record_batches(df_att_u, 500), "sitting_date,mp_name_raw")
     except Exception as e:
         raise RuntimeError(f"Upsert failed for hansard_attendance ({sitting_iso}): {e}")
 
     try:
-        for batch in chunk_records(_json_records(df_ptba_u), 500):
-            sb.table("hansard_ptba").upsert(batch, on_conflict="sitting_date,mp_name_raw,ptba_from,ptba_to").execute()
+        _upsert_batches(
+            sb, "hansard_ptba", iter_json_record_batches(df_ptba_u, 500), "sitting_date,mp_name_raw,ptba_from,ptba_to"
+        )
     except Exception as e:
         raise RuntimeError(f"Upsert failed for hansard_ptba ({sitting_iso}): {e}")
 
     def _upsert_speeches(df: pd.DataFrame):
-        for batch in chunk_records(_json_records(df), 300):
-            sb.table("hansard_speeches").upsert(batch, on_conflict="sitting_date,row_num").execute()
+        _upsert_batches(sb, "hansard_speeches", iter_json_record_batches(df, 300), "sitting_date,row_num")
 
     try:
         _upsert_speeches(df_speech_u)
@@ -1,8 +1,14 @@
 """HTTP fetch for the public Hansard JSON endpoint."""
 
-import requests
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Tuple
 
-from .config import BASE_URL
+from .config import BASE_URL, FETCH_CACHE_DIR
+from .http import SESSION
+from .utils import json_loads
 
 
 def fetch_hansard_json(sitting_ddmmyyyy: str) -> dict:
@@ -10,8 +16,49 @@ def fetch_hansard_json(sitting_ddmmyyyy: str) -> dict:
 
     The Parliament API expects ``DD-MM-YYYY``. Non-sitting days return an
     empty payload, which the parser handles by emitting empty DataFrames.
+
+    With ``FETCH_CACHE_DIR`` set, sittings with content are read from / saved
+    to ``<dir>/hansard_<DD-MM-YYYY>.json`` instead of re-downloaded.
     """
+    cache_path = os.path.join(FETCH_CACHE_DIR, f"hansard_{sitting_ddmmyyyy}.json") if FETCH_CACHE_DIR else ""
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return json_loads(f.read())
+
     url = f"{BASE_URL}?sittingDate={sitting_ddmmyyyy}"
-    r = requests.get(url, timeout=30)
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return r.json()
+    data = json_loads(r.content)
+
+    # Empty payloads are not cached: today's sitting may not be published yet
+    if cache_path and data and data.get("takesSectionVOList"):
+        os.makedirs(FETCH_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(r.content)
+        os.replace(tmp_path, cache_path)
+    return data
+
+
+def iter_hansard_json(
+    sitting_ddmmyyyys: Iterable[str], workers: int
+) -> Iterator[Tuple[str, Optional[dict], Optional[Exception]]]:
+    """Yield ``(ddmmyyyy, payload, error)`` in input order, fetching ahead.
+
+    Up to ``workers`` requests are in flight while the caller parses and
+    upserts the current day, so a long date range no longer pays one round
+    trip per day back to back. Exactly one of ``payload``/``error`` is set.
+    """
+    workers = max(1, workers)
+    dates = iter(sitting_ddmmyyyys)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque((d, executor.submit(fetch_hansard_json, d)) for d in islice(dates, workers))
+        while pending:
+            ddmmyyyy, future = pending.popleft()
+            nxt = next(dates, None)
+            if nxt is not None:
+                pending.append((nxt, executor.submit(fetch_hansard_json, nxt)))
+            try:
+                yield ddmmyyyy, future.result(), None
+            except Exception as e:
+                yield ddmmyyyy, None, e
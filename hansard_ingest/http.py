@@ -0,0 +1,35 @@
+"""Shared HTTP session for the Parliament and OpenAI APIs.
+
+One pooled ``requests.Session`` keeps keep-alive connections warm, so
+only the first call to each host pays the TCP + TLS handshake. Auth
+headers are passed per call rather than set on the session.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import BASE_URL
+
+SESSION = requests.Session()
+# Sized for the per-speech summary thread pool (AI_MAX_CONCURRENCY). Retries
+# stay with the callers, which already implement their own backoff.
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+# The Parliament endpoint has no caller-side retry, so a transient 429/5xx
+# would lose the day. Retry GETs with exponential backoff (0.5s, 1s, 2s, ...)
+# and honour Retry-After; the last response still reaches raise_for_status().
+SESSION.mount(
+    BASE_URL,
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
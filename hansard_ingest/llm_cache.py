@@ -0,0 +1,73 @@
+"""Local exact-match cache for validated per-speech summaries.
+
+Procedural boilerplate ("I beg to move...") repeats across rows and
+sittings, so identical prompts are answered from a SQLite file instead of
+the API. Keys hash everything that shapes the output (model, summary
+version, system prompt, user content); values are the validated JSON
+payload, so a hit also skips parsing/validation.
+
+Disabled unless ``AI_CACHE_PATH`` is set.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .config import AI_CACHE_PATH
+from .utils import json_loads
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+
+
+def enabled() -> bool:
+    return bool(AI_CACHE_PATH)
+
+
+def cache_key(*parts: str) -> str:
+    h = hashlib.sha256()
+    for p in parts:
+        h.update((p or "").encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        # Shared across the summary worker threads; every access holds _lock.
+        _conn = sqlite3.connect(AI_CACHE_PATH, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at TEXT NOT NULL)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    if not enabled():
+        return None
+    with _lock:
+        row = _connect().execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+    if not row:
+        return None
+    try:
+        return json_loads(row[0])
+    except json.JSONDecodeError:
+        return None
+
+
+def set(key: str, value: Dict[str, Any]) -> None:
+    if not enabled() or not value:
+        return
+    with _lock:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), datetime.utcnow().isoformat()),
+        )
+        conn.commit()
@@ -6,7 +6,10 @@ Failures on a single day are logged and skipped so one bad day cannot
 abort a long backfill window.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
 
 from .ai_summary import generate_ai_summary
 from .config import (
@@ -15,14 +18,16 @@ from .config import (
     DEBUG,
     SAVE_JSON,
     END_DATE_ISO,
+    FETCH_CONCURRENCY,
+    INGEST_WORKERS,
     MAX_DAYS_PER_RUN,
     RUN_DATE,
     SCRIPT_VERSION,
     SKIP_DB,
     START_DATE_ISO,
 )
-from .db import get_latest_sitting, supabase_client, upsert_all
-from .fetch import fetch_hansard_json
+from .db import Client, get_latest_sitting, supabase_client, upsert_all
+from .fetch import iter_hansard_json
 from .parse import parse_one_sitting
 from .utils import ddmmyyyy_from_date, maybe_write_csv, maybe_write_json, parse_run_date
 
@@ -58,60 +63,85 @@ def ingest():
         f"DEBUG={DEBUG}, SAVE_JSON={SAVE_JSON}, SKIP_DB={SKIP_DB})"
     )
 
-    d = start_dt
-    while d <= end_dt:
-        ddmmyyyy = ddmmyyyy_from_date(d)
-
+    days = [start_dt + timedelta(days=i) for i in range((end_dt - start_dt).days + 1)]
+    run_fetched_days(days, lambda d, ddmmyyyy, data: _ingest_day(sb, d, ddmmyyyy, data))
+
+
+def run_fetched_days(days: List[date], handle_day: Callable[[date, str, dict], None]) -> None:
+    """Fetch ``days`` ahead and call ``handle_day(d, ddmmyyyy, payload)`` for each.
+
+    Fetches run FETCH_CONCURRENCY ahead of the handlers. With INGEST_WORKERS=1
+    (the default) days are handled one by one in date order; higher values
+    handle that many days at once, finishing in any order. Fetch failures are
+    logged and the day skipped. ``handle_day`` does its own error handling.
+    """
+    fetched = iter_hansard_json((ddmmyyyy_from_date(d) for d in days), FETCH_CONCURRENCY)
+    workers = max(1, INGEST_WORKERS)
+    if workers == 1:
+        for d, (ddmmyyyy, data, fetch_error) in zip(days, fetched):
+            if fetch_error is not None:
+                print(f"Fetch failed for {ddmmyyyy}: {fetch_error}")
+                continue
+            handle_day(d, ddmmyyyy, data)
+        return
+
+    # At most `workers` fetched payloads wait on or run in the pool at a time
+    slots = threading.BoundedSemaphore(workers)
+    futures = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for d, (ddmmyyyy, data, fetch_error) in zip(days, fetched):
+            if fetch_error is not None:
+                print(f"Fetch failed for {ddmmyyyy}: {fetch_error}")
+                continue
+            slots.acquire()
+            future = executor.submit(handle_day, d, ddmmyyyy, data)
+            future.add_done_callback(lambda _f: slots.release())
+            futures.append(future)
+    for future in futures:
+        future.result()  # surface anything handle_day didn't catch, as the serial loop would
+
+
+def _ingest_day(sb: Optional[Client], d: date, ddmmyyyy: str, data: dict) -> None:
+    """Parse -> (optional AI summary) -> upsert for one fetched day."""
+    if DEBUG and SAVE_JSON:
+        maybe_write_json(data, f"hansard_{ddmmyyyy}.json")
+
+    try:
+        df_att, df_ptba, df_speech, source_url, parliament_no, sitting_dt = parse_one_sitting(data)
+    except Exception as e:
+        print(f"Parse failed for {ddmmyyyy}: {e}")
+        return
+
+    # ---- AI summary (optional) ----
+    ai_row = None
+    if AI_ENABLED:
         try:
-            data = fetch_hansard_json(ddmmyyyy)
+            ai_row = generate_ai_summary(d.isoformat(), df_speech)
+            if DEBUG and ai_row:
+                preview = ai_row.get("summary_3_sentences", "")[:120]
+                print(f"[DEBUG] AI summary generated for {ddmmyyyy}: {preview}...")
+            if AI_DRY_RUN and ai_row:
+                print(f"[AI_DRY_RUN] {d.isoformat()} summary:\n{ai_row.get('summary_3_sentences','')}")
         except Exception as e:
-            print(f"Fetch failed for {ddmmyyyy}: {e}")
-            d += timedelta(days=1)
-            continue
+            print(f"AI summary failed for {ddmmyyyy}: {e}")
+
+    if DEBUG:
+        maybe_write_csv(df_att, f"attendance_list_{ddmmyyyy}.csv")
+        maybe_write_csv(df_ptba, f"ptba_list_{ddmmyyyy}.csv")
+        maybe_write_csv(df_speech, f"speech_list_{ddmmyyyy}.csv")
 
-        if DEBUG and SAVE_JSON:
-            maybe_write_json(data, f"hansard_{ddmmyyyy}.json")
+    if len(df_att) == 0 and len(df_speech) == 0:
+        print(f"No sitting detected for {ddmmyyyy}; skipping insert")
+        return
 
+    if sb is None:
+        print(f"SKIP_DB=true; parsed {ddmmyyyy}: att={len(df_att)} ptba={len(df_ptba)} speech={len(df_speech)}")
+    else:
         try:
-            df_att, df_ptba, df_speech, source_url, parliament_no, sitting_dt = parse_one_sitting(data)
+            if AI_DRY_RUN:
+                # Prevent AI summary DB writes during dry run
+                ai_row = None
+            upsert_all(sb, df_att, df_ptba, df_speech, d.isoformat(), source_url, ai_summary_row=ai_row)
+            print(f"Inserted {ddmmyyyy}: att={len(df_att)} ptba={len(df_ptba)} speech={len(df_speech)}")
         except Exception as e:
-            print(f"Parse failed for {ddmmyyyy}: {e}")
-            d += timedelta(days=1)
-            continue
-
-        # ---- AI summary (optional) ----
-        ai_row = None
-        if AI_ENABLED:
-            try:
-                ai_row = generate_ai_summary(d.isoformat(), df_speech)
-                if DEBUG and ai_row:
-                    preview = ai_row.get("summary_3_sentences", "")[:120]
-                    print(f"[DEBUG] AI summary generated for {ddmmyyyy}: {preview}...")
-                if AI_DRY_RUN and ai_row:
-                    print(f"[AI_DRY_RUN] {d.isoformat()} summary:\n{ai_row.get('summary_3_sentences','')}")
-            except Exception as e:
-                print(f"AI summary failed for {ddmmyyyy}: {e}")
-
-        if DEBUG:
-            maybe_write_csv(df_att, f"attendance_list_{ddmmyyyy}.csv")
-            maybe_write_csv(df_ptba, f"ptba_list_{ddmmyyyy}.csv")
-            maybe_write_csv(df_speech, f"speech_list_{ddmmyyyy}.csv")
-
-        if len(df_att) == 0 and len(df_speech) == 0:
-            print(f"No sitting detected for {ddmmyyyy}; skipping insert")
-            d += timedelta(days=1)
-            continue
-
-        if sb is None:
-            print(f"SKIP_DB=true; parsed {ddmmyyyy}: att={len(df_att)} ptba={len(df_ptba)} speech={len(df_speech)}")
-        else:
-            try:
-                if AI_DRY_RUN:
-                    # Prevent AI summary DB writes during dry run
-                    ai_row = None
-                upsert_all(sb, df_att, df_ptba, df_speech, d.isoformat(), source_url, ai_summary_row=ai_row)
-                print(f"Inserted {ddmmyyyy}: att={len(df_att)} ptba={len(df_ptba)} speech={len(df_speech)}")
-            except Exception as e:
-                print(f"DB insert failed for {ddmmyyyy}: {e}")
-
-        d += timedelta(days=1)
+            print(f"DB insert failed for {ddmmyyyy}: {e}")
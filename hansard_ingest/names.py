@@ -4,18 +4,53 @@ The Hansard payload mixes raw labels ("Mr Speaker", "The Minister for
 Foreign Affairs (Dr Vivian Balakrishnan)", "Mr Chan Chun Sing (Tanjong
 Pagar), Coordinating Minister...") with attendance entries. This module
 normalises those into clean person names and matches speaker labels back
-to the attendance list using ``difflib`` (kept deterministic — no LLM,
-no network).
+to the attendance list using ``difflib`` (kept deterministic — no LLM, no
+network).
 """
 
+import functools
+import itertools
 import re
+from difflib import SequenceMatcher
 from typing import List, Optional, Tuple
 
-HONORIFICS_RE = r"(?:Mr|Ms|Mrs|Mdm|Madam|Miss|Dr|Prof|Professor|Er\s+Dr|Assoc\s*Prof\.?\s*Dr\.?|Assoc\s*Prof\.?)"
+# Prefix-factored, longer forms first ("Assoc Prof Dr" before "Assoc Prof",
+# "Professor" before "Prof"), so the engine settles on one branch per leading
+# letter instead of trying each alternative in turn.
+HONORIFICS_RE = r"(?:Assoc\s*Prof\.?(?:\s*Dr\.?)?|Er\s+Dr|Prof(?:essor)?|M(?:adam|iss|rs|dm|r|s)|Dr)"
 
 # Names that the Chair calls out (not substantive speeches)
 CHAIR_CALL_HONORIFICS_RE = r"(?:Mr|Ms|Mrs|Mdm|Madam|Miss|Dr|Assoc\s+Prof\s+Dr|Assoc\s+Prof|Professor|Prof|Er)"
 
+# Compiled once: these run for every speech row and attendance entry.
+_PARENS_RE = re.compile(r"\([^)]*\)")
+_TRAILING_PARENS_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_PAREN_CHUNK_RE = re.compile(r"\(([^()]*)\)")
+_ALPHA_RUN_RE = re.compile(r"[A-Za-z]+")
+_NON_ALPHA_RE = re.compile(r"[^A-Za-z\s]")
+_WORD_RE = re.compile(r"\b\w+\b")
+_HONORIFIC_PREFIX_RE = re.compile(r"^(%s)\s+" % HONORIFICS_RE, re.I)
+_HONORIFIC_PREFIXES_RE = re.compile(r"^(?:(%s)\s+)+" % HONORIFICS_RE, re.I)
+_PERSON_IN_PARENS_RE = re.compile(r"\((%s)\s+[^)]+\)" % HONORIFICS_RE, re.I)
+_SPEAKER_WORD_RE = re.compile(r"\bSPEAKER\b", re.I)
+_SPEAKER_PAREN_RE = re.compile(r"\bSPEAKER\s*\(", re.I)
+_ROLE_WORDS_RE = re.compile(r"\b(MINISTER|PRIME|DEPUTY|PARLIAMENTARY|SECRETARY|SPEAKER)\b", re.I)
+_ROLE_TOKENS = frozenset({"MINISTER", "PRIME", "DEPUTY", "PARLIAMENTARY", "SECRETARY", "SPEAKER"})
+# str.translate tables for norm_for_match's ASCII path
+_ASCII_NON_WORD_TO_SPACE = {
+    c: " " for c in range(128) if not (chr(c).isalnum() or chr(c) == "_" or chr(c).isspace())
+}
+_DIGIT_UNDERSCORE_TO_SPACE = str.maketrans("0123456789_", " " * 11)
+_TRAILING_CHAIR_CALL_RE = re.compile(r"\s+(Mr|Madam)\s+Speaker\.?\s*$", re.I)
+_CHAIR_MARKER_RE = re.compile(r"^\[(.+?)\s+in\s+the\s+Chair\.?\]\s*$", re.I)
+_CHAIR_CALL_START_RE = re.compile(rf"^({CHAIR_CALL_HONORIFICS_RE})\b", re.I)
+_NOT_CHAIR_CALL_RE = re.compile(
+    r"\b(thank|ask|welcome|move|agree|urge|request|clarif|supplementary|question)\b", re.I
+)
+_ASKED_MINISTER_RE = re.compile(
+    r"\basked\s+(?:the\s+)?(?:minister|prime minister|deputy prime minister|parliamentary secretary)\b", re.I
+)
+
 
 def chair_role(chair_raw: str):
     if not chair_raw:
@@ -31,7 +66,13 @@ def chair_role(chair_raw: str):
 def strip_trailing_chair_call(text: str) -> str:
     if not text:
         return text
-    return re.sub(r"\s+(Mr|Madam)\s+Speaker\.?\s*$", "", text, flags=re.I).rstrip()
+    text = text.rstrip()
+    # The pattern can only match when the text ends in "Speaker[.]"; checking the
+    # tail first avoids a regex scan over every paragraph. casefold() keeps the
+    # check as permissive as re.I.
+    if "speaker" not in text[-8:].casefold():
+        return text
+    return _TRAILING_CHAIR_CALL_RE.sub("", text).rstrip()
 
 
 def name_key(name_raw: str) -> str:
@@ -39,10 +80,11 @@ def name_key(name_raw: str) -> str:
     if not name_raw:
         return ""
     s = str(name_raw).strip()
-    s = re.sub(r"^(%s)\s+" % HONORIFICS_RE, "", s, flags=re.I)
-    s = re.sub(r"\([^)]*\)", "", s)      # remove constituency etc
-    s = s.split(",")[0]                  # remove roles/portfolios
-    s = re.sub(r"\s+", " ", s).strip(" .")
+    s = _HONORIFIC_PREFIX_RE.sub("", s)
+    if "(" in s:
+        s = _PARENS_RE.sub("", s)        # remove constituency etc
+    s = s.split(",", 1)[0]               # remove roles/portfolios
+    s = " ".join(s.split()).strip(" .")
     return s.upper()
 
 
@@ -50,7 +92,7 @@ def extract_chair_marker(text: str):
     t = (text or "").strip()
     if "in the Chair" not in t or not t.startswith("[") or "SPEAKER" not in t.upper():
         return None
-    m = re.match(r"^\[(.+?)\s+in\s+the\s+Chair\.?\]\s*$", t, flags=re.I)
+    m = _CHAIR_MARKER_RE.match(t)
     return m.group(1).strip() if m else None
 
 
@@ -70,6 +112,14 @@ def infer_chair_from_speaker_label(speaker_raw: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=512)
+def _question_paper_pattern(speaker_raw: str) -> re.Pattern:
+    """'<n> <speaker> asked' pattern, keyed by the raw label so the label's
+    whitespace collapse and escape also run once per distinct speaker."""
+    sp = " ".join(speaker_raw.split())
+    return re.compile(rf"^\d+\s+{re.escape(sp)}\s+asked\b", flags=re.I)
+
+
 def is_question_paper_item(speaker_raw: str, speech: str) -> bool:
     """
     Detect non-spoken Question Time listings like:
@@ -78,19 +128,19 @@ def is_question_paper_item(speaker_raw: str, speech: str) -> bool:
     """
     if not speaker_raw or not speech:
         return False
-    s = re.sub(r"\s+", " ", speech.replace("\xa0", " ")).strip()
-    sp = re.sub(r"\s+", " ", speaker_raw).strip()
+    s = " ".join(speech.split())  # NBSP is whitespace to str.split
+    # Cheap gates before the regex: the item must open with its question number
+    # (isdigit() admits every \d) and contain " asked" (casefold() admits
+    # everything re.I would, e.g. long s).
+    if not s[:1].isdigit() or " asked" not in s.casefold():
+        return False
 
     # Must start with a question number, then the same speaker name, then "asked"
-    pat = re.compile(rf"^\d+\s+{re.escape(sp)}\s+asked\b", flags=re.I)
-    if not pat.search(s):
+    if not _question_paper_pattern(speaker_raw).search(s):
         return False
 
     # Usually directed at Minister/PM/etc
-    return re.search(
-        r"\basked\s+(?:the\s+)?(?:minister|prime minister|deputy prime minister|parliamentary secretary)\b",
-        s, flags=re.I
-    ) is not None
+    return _ASKED_MINISTER_RE.search(s) is not None
 
 
 # Detect procedural Chair call-outs like 'Mr Patrick Tay.' or 'Er Dr Lee Bee Wah.'
@@ -102,18 +152,19 @@ def is_chair_call_to_member(text: str) -> bool:
     """
     if not text:
         return False
-    t = re.sub(r"\s+", " ", str(text).replace("\xa0", " ")).strip()
+    # Called for every Chair row, so the checks run cheapest first and on the
+    # raw text: whitespace runs (incl. NBSP) don't change any of their outcomes.
+    t = str(text).strip()
     # Common formats end with a period; keep this conservative
     if not t.endswith("."):
         return False
-    # Very short and looks like a name with honorific
-    words = re.findall(r"\b\w+\b", t)
-    if len(words) > 7:
+    if not _CHAIR_CALL_START_RE.match(t):
         return False
-    if not re.match(rf"^({CHAIR_CALL_HONORIFICS_RE})\b", t, flags=re.I):
+    # Very short and looks like a name with honorific (stop counting at 8 words)
+    if sum(1 for _ in itertools.islice(_WORD_RE.finditer(t), 8)) > 7:
         return False
     # Avoid treating actual sentences as call-outs
-    if re.search(r"\b(thank|ask|welcome|move|agree|urge|request|clarif|supplementary|question)\b", t, flags=re.I):
+    if _NOT_CHAIR_CALL_RE.search(t):
         return False
     return True
 
@@ -133,40 +184,41 @@ def extract_person_from_speaker_attendance(mp_name_raw: str) -> Optional[str]:
     inner = s[l + 1 : r].strip().strip(".")
 
     # Drop trailing constituency parentheses if present
-    inner = re.sub(r"\s*\([^)]*\)\s*$", "", inner).strip(" .")
+    inner = _TRAILING_PARENS_RE.sub("", inner).strip(" .")
 
     # Drop honorific for chair_name output
-    inner = re.sub(r"^(%s)\s+" % HONORIFICS_RE, "", inner, flags=re.I)
+    inner = _HONORIFIC_PREFIX_RE.sub("", inner)
 
     return inner.strip() or None
 
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_person_from_name(raw: str) -> Optional[str]:
     """Best-effort extraction of a person's name from a label; keeps it deterministic (no web/LLM)."""
     if not raw:
         return None
     s = str(raw).strip()
     # Match a person name inside parentheses, including multi-token honorifics like 'Assoc Prof Dr'
-    m = re.search(r"\((%s)\s+[^)]+\)" % HONORIFICS_RE, s, flags=re.I)
+    m = _PERSON_IN_PARENS_RE.search(s)
     if m:
         inner = m.group(0).strip("() ")
         # Remove any trailing constituency parentheses within the captured text
-        inner = re.sub(r"\s*\([^)]*\)\s*$", "", inner).strip(" .")
+        inner = _TRAILING_PARENS_RE.sub("", inner).strip(" .")
         # Remove leading honorific(s)
-        inner = re.sub(r"^(?:(%s)\s+)+" % HONORIFICS_RE, "", inner, flags=re.I).strip()
-        inner = re.sub(r"\s+", " ", inner).strip(" .")
+        inner = _HONORIFIC_PREFIXES_RE.sub("", inner).strip()
+        inner = " ".join(inner.split()).strip(" .")
         return inner.strip() or None
 
     # If label is 'Mr Speaker' or 'Mr Deputy Speaker' etc, return None (resolved via attendance map)
-    if re.search(r"\bSPEAKER\b", s, flags=re.I):
+    if _SPEAKER_WORD_RE.search(s):
         return None
 
     # Otherwise treat it as already a person name; remove honorific, any parentheses, and trailing roles
-    s2 = re.sub(r"^(%s)\s+" % HONORIFICS_RE, "", s, flags=re.I)
+    s2 = _HONORIFIC_PREFIX_RE.sub("", s)
     s2 = s2.split(",", 1)[0].strip()
-    s2 = re.sub(r"\([^)]*\)", " ", s2)  # remove any parentheses anywhere
-    s2 = re.sub(r"\s+", " ", s2).strip(" .")
+    s2 = _PARENS_RE.sub(" ", s2)  # remove any parentheses anywhere
+    s2 = " ".join(s2.split()).strip(" .")
     return s2.strip() or None
 
 
@@ -181,21 +233,24 @@ def extract_last_parenthesized_text(s: str) -> Optional[str]:
     """
     if not s:
         return None
-    parts = re.findall(r"\(([^()]*)\)", str(s))
+    parts = _PAREN_CHUNK_RE.findall(str(s))
     if not parts:
         return None
     last = parts[-1].strip().strip(".")
     # Must look name-like (at least 2 alphabetic tokens)
-    if len(re.findall(r"[A-Za-z]+", last)) < 2:
+    if len(_ALPHA_RUN_RE.findall(last)) < 2:
         return None
     # Strip leading honorific tokens if present
-    last = re.sub(r"^(?:(%s)\s+)+" % HONORIFICS_RE, "", last, flags=re.I).strip()
-    last = re.sub(r"\s+", " ", last).strip(" .")
+    last = _HONORIFIC_PREFIXES_RE.sub("", last).strip()
+    last = " ".join(last.split()).strip(" .")
     return last or None
 
 
 # ----------- Name cleaning and fuzzy matching helpers -----------
+# The same labels recur on every speech a Member gives, so the pure
+# string -> name helpers below are memoised.
 
+@functools.lru_cache(maxsize=4096)
 def clean_mp_name_from_attendance(raw: str) -> Optional[str]:
     """Return the person's name (no honorific, no constituency, no portfolios).
 
@@ -211,14 +266,14 @@ def clean_mp_name_from_attendance(raw: str) -> Optional[str]:
     # Special case: 'Mr SPEAKER (Mr Seah Kian Peng (Marine Parade)).'
     # IMPORTANT: do NOT trigger for 'Deputy Speaker' attendance lines.
     u = s.upper()
-    if "DEPUTY SPEAKER" not in u and re.search(r"\bSPEAKER\s*\(", s, flags=re.I):
+    if "DEPUTY SPEAKER" not in u and _SPEAKER_PAREN_RE.search(s):
         sp = extract_person_from_speaker_attendance(s)
         if sp:
             return sp
 
     # If the label contains a person's name in parentheses (e.g. role titles in speech list), extract it
     # Examples: 'The Minister for Foreign Affairs (Dr Vivian Balakrishnan)'
-    if re.search(r"\((%s)\s+[^)]+\)" % HONORIFICS_RE, s, flags=re.I):
+    if _PERSON_IN_PARENS_RE.search(s):
         person = extract_person_from_name(s)
         if person:
             return person
@@ -227,48 +282,77 @@ def clean_mp_name_from_attendance(raw: str) -> Optional[str]:
     s = s.split(",", 1)[0].strip()
 
     # Remove trailing constituency parentheses
-    s = re.sub(r"\s*\([^)]*\)\s*$", "", s).strip(" .")
+    s = _TRAILING_PARENS_RE.sub("", s).strip(" .")
 
     # Remove one or more leading honorific tokens (e.g. 'Assoc Prof Dr', 'Dr', etc.)
-    s = re.sub(r"^(?:(%s)\s+)+" % HONORIFICS_RE, "", s, flags=re.I).strip()
+    s = _HONORIFIC_PREFIXES_RE.sub("", s).strip()
 
     # Remove any lingering all-caps SPEAKER tokens (rare)
-    s = re.sub(r"\bSPEAKER\b", "", s, flags=re.I).strip()
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _SPEAKER_WORD_RE.sub("", s).strip()
+    s = " ".join(s.split())
 
     return s or None
 
 
+@functools.lru_cache(maxsize=4096)
 def norm_for_match(s: str) -> str:
     if not s:
         return ""
     x = str(s)
     x = x.replace("\u00a0", " ")
-    x = re.sub(r"\([^)]*\)", " ", x)  # drop parentheses chunks
+    if "(" in x:
+        x = _PARENS_RE.sub(" ", x)  # drop parentheses chunks
     x = x.split(",", 1)[0]
-    x = re.sub(r"^(%s)\s+" % HONORIFICS_RE, "", x, flags=re.I)
-    x = re.sub(r"\b(MINISTER|PRIME|DEPUTY|PARLIAMENTARY|SECRETARY|SPEAKER)\b", " ", x, flags=re.I)
-    x = re.sub(r"[^A-Za-z\s]", " ", x)
-    x = re.sub(r"\s+", " ", x).strip().upper()
+    x = _HONORIFIC_PREFIX_RE.sub("", x)
+    if x.isascii():
+        # One scan instead of the three regex passes below, same result: split
+        # into word runs, drop runs that are role words, then anything that
+        # isn't a letter separates tokens.
+        toks = [t for t in x.translate(_ASCII_NON_WORD_TO_SPACE).upper().split() if t not in _ROLE_TOKENS]
+        return " ".join(" ".join(toks).translate(_DIGIT_UNDERSCORE_TO_SPACE).split())
+    x = _ROLE_WORDS_RE.sub(" ", x)
+    x = _NON_ALPHA_RE.sub(" ", x)
+    x = " ".join(x.split()).upper()
     return x
 
 
-def best_fuzzy_match(query: str, choices: List[str]) -> Tuple[Optional[str], float]:
-    """Return (best_choice, score) using difflib; score in [0,1]."""
-    from difflib import SequenceMatcher
+def best_fuzzy_match(
+    query: str,
+    choices: List[str],
+    normed_choices: Optional[List[str]] = None,
+    score_cutoff: float = 0.0,
+) -> Tuple[Optional[str], float]:
+    """Return (best_choice, score); score in [0,1].
 
+    ``normed_choices`` is ``[norm_for_match(c) for c in choices]``; callers
+    matching many queries against the same list pass it in once.
+    ``score_cutoff`` lets the loop skip choices that cannot reach it; if the
+    best score is below it, ``(None, 0.0)`` is returned.
+    """
     q = norm_for_match(query)
     if not q:
         return None, 0.0
+    if normed_choices is None:
+        normed_choices = [norm_for_match(c) for c in choices]
 
     best = None
     best_score = 0.0
-    for c in choices:
-        cs = norm_for_match(c)
+    sm = SequenceMatcher(None)
+    sm.set_seq1(q)
+    for c, cs in zip(choices, normed_choices):
         if not cs:
             continue
-        sc = SequenceMatcher(None, q, cs).ratio()
-        if sc > best_score:
+        sm.set_seq2(cs)
+        # Cheap upper bounds first; the choice can't win if these can't beat
+        # best_score or reach score_cutoff
+        rqr = sm.real_quick_ratio()
+        if rqr <= best_score or rqr < score_cutoff:
+            continue
+        qr = sm.quick_ratio()
+        if qr <= best_score or qr < score_cutoff:
+            continue
+        sc = sm.ratio()
+        if sc > best_score and sc >= score_cutoff:
             best_score = sc
             best = c
     return best, best_score
@@ -12,11 +12,13 @@ cleaning and fuzzy-matching against the attendance list.
 """
 
 import re
+import threading
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from .config import BASE_URL, DEBUG
 from .names import (
@@ -35,7 +37,58 @@ from .names import (
     norm_for_match,
     strip_trailing_chair_call,
 )
-from .utils import extract_year, parse_day_month, parse_sitting_date, word_count
+from .utils import extract_year, normalize_df_pk_cols, parse_day_month, parse_sitting_date, word_count
+
+# Compiled once rather than per tag / per speech row.
+_DEPUTY_HONORIFIC_RE = re.compile(r"^(Mr|Ms|Mdm|Madam|Miss|Dr)\b", re.I)
+_QUESTION_NUMBER_RE = re.compile(r"(^|\s)\d{1,3}\s+(?=(?:%s)\b|To ask\b)" % HONORIFICS_RE, re.I)
+_NON_UPPER_RE = re.compile(r"[^A-Z]")
+
+_SPEECH_TAGS = ("p", "h6", "h5", "h4", "h3", "h2", "h1")
+
+# Output column order for each DataFrame
+_PTBA_COLUMNS = ["parliament_no","sitting_date","mp_name_raw","mp_name_cleaned","ptba_from","ptba_to"]
+_ATT_COLUMNS = [
+    "parliament_no","sitting_date","mp_name_raw","mp_name_cleaned","dim_is_speaker","dim_is_deputy_speaker","dim_is_present"
+]
+_SPEECH_COLUMNS = [
+    "parliament_no","sitting_date","row_num","discussion_title","section_type",
+    "mp_name_raw","mp_name_fuzzy_matched","speech_details","word_count",
+    "dim_speaker","chair_name_raw",
+    "dim_is_question_for_oral_answer","dim_is_oral_speech",
+    "dim_is_written_answer_not_answered","dim_is_written_answer_to_questions",
+]
+
+
+# get_text() never counted text inside these as part of a speech
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+# lxml parsers must not be shared between threads (sittings are parsed in a
+# worker pool), so each thread keeps one for all of its sections.
+_parser_local = threading.local()
+
+
+def _section_root(html: str):
+    """Parse one section's HTML with libxml2, without script/style text.
+
+    The HTML is fed as UTF-8 bytes to a parser with that encoding fixed, so an
+    ``<?xml ... encoding=...?>`` prolog is ignored instead of raising.
+    Raises ``etree.ParserError`` for whitespace- or comment-only sections.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = lxml_html.HTMLParser(encoding="utf-8")
+    root = lxml_html.document_fromstring(html.encode("utf-8", "replace"), parser=parser)
+    # Emptied rather than removed, so the text either side stays separate
+    for el in list(root.iter(*_NON_TEXT_TAGS)):
+        el.text = None
+        del el[:]
+    return root
+
+
+def _tag_text(el) -> str:
+    """Visible text of an element: stripped text nodes joined by single spaces."""
+    return " ".join(t for t in (s.strip() for s in el.itertext()) if t)
 
 
 def ptba_overlaps_sitting(rec: dict, sitting_dt: date, default_year: int) -> bool:
@@ -73,40 +126,57 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
     parliament_no = infer_parliament_no_from_metadata(data)
     source_url = f"{BASE_URL}?sittingDate={data['metadata']['sittingDate']}"
 
-    # Map chair titles to actual person names using attendance list
+    # Rows are collected column-wise (one list per output column) and turned
+    # into a DataFrame once, instead of building a dict per row.
+
+    # One pass over the attendance list builds:
+    #   - Chair title -> person maps (Speaker / Deputy Speakers)
+    #   - cleaned names and their match keys for fuzzy matching speaker labels
+    #   - the attendance rows themselves
     speaker_person: Optional[str] = None
     deputy_display: Dict[str, str] = {}
     deputy_by_honorific: Dict[str, str] = {}
+    # Unique cleaned names in first-seen order -> their norm_for_match key
+    clean_to_norm: Dict[str, str] = {}
+    attendance_norm_to_clean: Dict[str, str] = {}
+    att_cols: Dict[str, list] = {c: [] for c in _ATT_COLUMNS}
 
     for item in data.get("attendanceList", []):
         raw_att = (item.get("mpName") or "").strip()
+        if not raw_att:
+            # Skip blank/separator rows to avoid creating duplicate keys
+            continue
         u_att = raw_att.upper()
-        if "SPEAKER" in u_att and "DEPUTY" not in u_att and speaker_person is None:
+        is_speaker = "SPEAKER" in u_att and "DEPUTY" not in u_att
+        is_deputy_speaker = "DEPUTY SPEAKER" in u_att
+
+        if is_speaker and speaker_person is None:
             speaker_person = extract_person_from_speaker_attendance(raw_att)
-        if "DEPUTY SPEAKER" in u_att:
+        if is_deputy_speaker:
             k = name_key(raw_att)
             disp = extract_person_from_name(raw_att)
             if k and disp:
                 deputy_display[k] = disp
-            m = re.match(r"^(Mr|Ms|Mdm|Madam|Miss|Dr)\b", raw_att.strip(), flags=re.I)
+            m = _DEPUTY_HONORIFIC_RE.match(raw_att)
             if m and disp:
                 deputy_by_honorific[m.group(1).upper()] = disp
 
-    # Build attendance name mappings for cleaning + fuzzy matching
-    attendance_choices_clean: List[str] = []
-    _seen_clean: set = set()
-    for item in data.get("attendanceList", []):
-        raw_att = (item.get("mpName") or "").strip()
         cleaned = clean_mp_name_from_attendance(raw_att)
-        if cleaned and cleaned not in _seen_clean:
-            attendance_choices_clean.append(cleaned)
-            _seen_clean.add(cleaned)
-
-    attendance_norm_to_clean: Dict[str, str] = {}
-    for nm in attendance_choices_clean:
-        nn = norm_for_match(nm)
-        if nn and nn not in attendance_norm_to_clean:
-            attendance_norm_to_clean[nn] = nm
+        if cleaned and cleaned not in clean_to_norm:
+            nn = clean_to_norm[cleaned] = norm_for_match(cleaned)
+            if nn and nn not in attendance_norm_to_clean:
+                attendance_norm_to_clean[nn] = cleaned
+
+        att_cols["sitting_date"].append(sitting_date)
+        att_cols["parliament_no"].append(parliament_no)
+        att_cols["mp_name_raw"].append(raw_att)
+        att_cols["mp_name_cleaned"].append(cleaned)
+        att_cols["dim_is_speaker"].append(1 if is_speaker else 0)
+        att_cols["dim_is_deputy_speaker"].append(1 if is_deputy_speaker else 0)
+        att_cols["dim_is_present"].append(1 if item.get("attendance") else 0)
+
+    attendance_choices_clean = list(clean_to_norm)
+    attendance_choices_norm = list(clean_to_norm.values())  # parallel, for best_fuzzy_match
 
     def canonicalize_to_attendance(name: Optional[str]) -> Optional[str]:
         if not name:
@@ -114,7 +184,7 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
         nn = norm_for_match(name)
         return attendance_norm_to_clean.get(nn, name)
 
-    def chair_display_name(chair_label: str) -> str:
+    def resolve_chair_display_name(chair_label: str) -> str:
         if not chair_label:
             return ""
         role = chair_role(chair_label)
@@ -125,7 +195,7 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
             return speaker_person
         if role == "deputy_speaker":
             lab = chair_label.strip()
-            m = re.match(r"^(Mr|Ms|Mdm|Madam|Miss|Dr)\b", lab, flags=re.I)
+            m = _DEPUTY_HONORIFIC_RE.match(lab)
             if m:
                 h = m.group(1).upper()
                 if h in deputy_by_honorific:
@@ -140,35 +210,82 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
                 return list(deputy_display.values())[0]
         return chair_label
 
+    chair_info_cache: Dict[str, Tuple[Optional[str], str, Optional[str]]] = {}
+
+    def chair_info(chair_label: str) -> Tuple[Optional[str], str, Optional[str]]:
+        """(chair role, display name, attendance-canonical name) for a Chair label."""
+        # The Chair only changes at "[... in the Chair.]" markers, and the maps
+        # above are complete by now, so resolve each label once per sitting.
+        info = chair_info_cache.get(chair_label)
+        if info is None:
+            display = resolve_chair_display_name(chair_label)
+            info = chair_info_cache[chair_label] = (
+                chair_role(chair_label), display, canonicalize_to_attendance(display)
+            )
+        return info
+
+    speaker_match_cache: Dict[str, Optional[str]] = {}
+    # Role-titled and bare labels ("The Minister for X (Dr A)", "Dr A") reduce
+    # to the same query; best_fuzzy_match depends only on its normalised form.
+    fuzzy_match_cache: Dict[str, Optional[str]] = {}
+
+    def match_speaker(speaker_raw: str) -> Optional[str]:
+        """Attendance name for a non-Chair speaker label, or None if nothing is close."""
+        # Depends only on the label and the attendance list, so each distinct
+        # label is matched once per sitting rather than once per speech.
+        if speaker_raw in speaker_match_cache:
+            return speaker_match_cache[speaker_raw]
+
+        # speaker_raw may be a role title with the person in parentheses.
+        # Prefer extracting the actual person name for matching.
+        extracted_person = extract_person_from_name(speaker_raw) or extract_last_parenthesized_text(speaker_raw)
+        q_clean = extracted_person or clean_mp_name_from_attendance(speaker_raw) or speaker_raw
+
+        q_norm = norm_for_match(q_clean)
+        if q_norm and q_norm in attendance_norm_to_clean:
+            # Already canonical: it is the first attendance name with this norm
+            match = attendance_norm_to_clean[q_norm]
+        elif q_norm in fuzzy_match_cache:
+            match = fuzzy_match_cache[q_norm]
+        else:
+            # Slightly looser threshold to reduce false negatives for older Hansards
+            best, _ = best_fuzzy_match(q_clean, attendance_choices_clean, attendance_choices_norm, score_cutoff=0.75)
+            match = fuzzy_match_cache[q_norm] = canonicalize_to_attendance(best) if best else None
+        speaker_match_cache[speaker_raw] = match
+        return match
+
     # -------- PTBA --------
-    ptba_rows: List[dict] = []
+    ptba_cols: Dict[str, list] = {c: [] for c in _PTBA_COLUMNS + ["dim_overlaps_sitting_date"]}
     current_mp: Optional[str] = None
+    current_mp_cleaned: Optional[str] = None  # cleaned once per mpName, not per row
+    # Many Members share the same leave window; parse each (from, to) pair once.
+    overlap_by_window: Dict[Tuple[object, object], int] = {}
     for rec in data.get("ptbaList", []):
         mp = rec.get("mpName")
         if mp is not None and str(mp).strip():
             current_mp = str(mp).strip()
+            current_mp_cleaned = clean_mp_name_from_attendance(current_mp)
         if current_mp is None:
             continue
-        ptba_rows.append({
-            "sitting_date": sitting_date,
-            "parliament_no": parliament_no,
-            "mp_name_raw": current_mp,
-            "mp_name_cleaned": clean_mp_name_from_attendance(current_mp),
-            "ptba_from": rec.get("from"),
-            "ptba_to": rec.get("to"),
-            "dim_overlaps_sitting_date": 1 if ptba_overlaps_sitting(rec, sitting_dt, default_year) else 0,
-        })
-
-    df_ptba_all = pd.DataFrame(ptba_rows)
-    if not df_ptba_all.empty:
-        df_ptba = df_ptba_all[df_ptba_all["dim_overlaps_sitting_date"] == 1][[
-            "parliament_no","sitting_date","mp_name_raw","mp_name_cleaned","ptba_from","ptba_to"
-        ]].reset_index(drop=True)
+        ptba_cols["sitting_date"].append(sitting_date)
+        ptba_cols["parliament_no"].append(parliament_no)
+        ptba_cols["mp_name_raw"].append(current_mp)
+        ptba_cols["mp_name_cleaned"].append(current_mp_cleaned)
+        ptba_cols["ptba_from"].append(rec.get("from"))
+        ptba_cols["ptba_to"].append(rec.get("to"))
+        window = (rec.get("from"), rec.get("to"))
+        overlaps = overlap_by_window.get(window)
+        if overlaps is None:
+            overlaps = overlap_by_window[window] = 1 if ptba_overlaps_sitting(rec, sitting_dt, default_year) else 0
+        ptba_cols["dim_overlaps_sitting_date"].append(overlaps)
+
+    if ptba_cols["mp_name_raw"]:
+        df_ptba_all = pd.DataFrame(ptba_cols)
+        df_ptba = df_ptba_all[df_ptba_all["dim_overlaps_sitting_date"] == 1][_PTBA_COLUMNS].reset_index(drop=True)
 
         # De-dup on the actual table PK so CSVs (and any non-upsert insertion path) stay safe.
         # PK: (sitting_date, mp_name_raw, ptba_from, ptba_to)
-        from .utils import normalize_df_pk_cols
-        df_ptba = normalize_df_pk_cols(df_ptba, ["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"])
+        df_ptba = normalize_df_pk_cols(df_ptba, ["sitting_date", "mp_name_raw", "ptba_from", "ptba_to"], inplace=True)
         before_n = len(df_ptba)
         df_ptba = df_ptba.drop_duplicates(
             subset=["sitting_date","mp_name_raw","ptba_from","ptba_to"],
@@ -178,61 +295,81 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
         if DEBUG and before_n != after_n:
             print(f"[DEBUG] PTBA de-dup removed {before_n - after_n} rows (kept {after_n}).")
     else:
-        df_ptba = pd.DataFrame(columns=["parliament_no","sitting_date","mp_name_raw","mp_name_cleaned","ptba_from","ptba_to"])
+        df_ptba = pd.DataFrame(columns=_PTBA_COLUMNS)
 
     # -------- Attendance --------
-    att_rows: List[dict] = []
-    for item in data.get("attendanceList", []):
-        raw = (item.get("mpName") or "").strip()
-        if not raw:
-            # Skip blank/separator rows to avoid creating duplicate keys
-            continue
-        u = raw.upper()
-        present = 1 if item.get("attendance") else 0
-
-        cleaned = clean_mp_name_from_attendance(raw)
-
-        att_rows.append({
-            "sitting_date": sitting_date,
-            "parliament_no": parliament_no,
-            "mp_name_raw": raw,
-            "mp_name_cleaned": cleaned,
-            "dim_is_speaker": 1 if ("SPEAKER" in u and "DEPUTY" not in u) else 0,
-            "dim_is_deputy_speaker": 1 if ("DEPUTY SPEAKER" in u) else 0,
-            "dim_is_present": present,
-        })
-
-    df_att = pd.DataFrame(att_rows)[[
-        "parliament_no","sitting_date","mp_name_raw","mp_name_cleaned","dim_is_speaker","dim_is_deputy_speaker","dim_is_present"
-    ]]
+    # Rows were collected in the attendance pass above
+    df_att = pd.DataFrame(att_cols)
 
     # -------- Speeches --------
-    speech_rows: List[dict] = []
+    speech_cols: Dict[str, list] = {c: [] for c in _SPEECH_COLUMNS}
+    # Columns the continuation path updates in place
+    speech_details_col = speech_cols["speech_details"]
+    word_count_col = speech_cols["word_count"]
     row_num = 0
+    # Paragraphs of the latest speech. Continuations only ever extend the
+    # latest speech, so they are joined once, when the next speech starts.
+    last_speech_parts: List[str] = []
+
+    def flush_speech_parts():
+        if len(last_speech_parts) > 1:
+            speech_details_col[-1] = "\n\n".join(last_speech_parts)
+        last_speech_parts.clear()
     # Start with metadata speaker if provided
     current_chair = (data.get("metadata") or {}).get("speaker") or "Mr Speaker"
 
+    def add_speech_row(
+        mp_name_raw: str,
+        mp_name_fuzzy_matched: Optional[str],
+        speech_details: str,
+        dim_speaker: Optional[str],
+        chair_name_raw: Optional[str],
+        dim_is_question_for_oral_answer: int,
+        dim_is_oral_speech: int,
+    ):
+        # Section-level fields come from the section loop below
+        nonlocal row_num
+        flush_speech_parts()
+        last_speech_parts.append(speech_details)
+        row_num += 1
+        speech_cols["sitting_date"].append(sitting_date)
+        speech_cols["parliament_no"].append(parliament_no)
+        speech_cols["row_num"].append(row_num)
+        speech_cols["discussion_title"].append(discussion_title)
+        speech_cols["section_type"].append(sec_type)
+        speech_cols["mp_name_raw"].append(mp_name_raw)
+        speech_cols["mp_name_fuzzy_matched"].append(mp_name_fuzzy_matched)
+        speech_details_col.append(speech_details)
+        word_count_col.append(word_count(speech_details))
+        speech_cols["dim_speaker"].append(dim_speaker)
+        speech_cols["chair_name_raw"].append(chair_name_raw)
+        speech_cols["dim_is_question_for_oral_answer"].append(dim_is_question_for_oral_answer)
+        speech_cols["dim_is_oral_speech"].append(dim_is_oral_speech)
+        speech_cols["dim_is_written_answer_not_answered"].append(dim_is_written_answer_not_answered)
+        speech_cols["dim_is_written_answer_to_questions"].append(dim_is_written_answer_to_questions)
+
     def append_continuation(text: str):
-        if not speech_rows:
+        if not row_num:
             return
         text2 = strip_trailing_chair_call(text).strip()
         if not text2:
             return
-        speech_rows[-1]["speech_details"] = (speech_rows[-1]["speech_details"] + "\n\n" + text2).strip()
-        speech_rows[-1]["word_count"] = word_count(speech_rows[-1]["speech_details"])
+        # Both sides are stripped and non-empty, so the join needs no re-strip and
+        # word counts add up (no word can span the paragraph break).
+        last_speech_parts.append(text2)
+        word_count_col[-1] += word_count(text2)
 
     def strip_question_number(text: str) -> str:
         if not text:
             return text
         # Remove leading question numbers like "1 Mr ..." or "2 To ask ...", even mid-sentence.
-        pat = r"(^|\s)\d{1,3}\s+(?=(?:%s)\b|To ask\b)" % HONORIFICS_RE
-        cleaned = re.sub(pat, " ", str(text), flags=re.I)
-        return re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _QUESTION_NUMBER_RE.sub(" ", str(text))
+        return " ".join(cleaned.split())
 
     for sec in data.get("takesSectionVOList", []):
         sec_type_raw = (sec.get("sectionType") or "")
         # Normalize aggressively: strip, uppercase, then keep only letters (handles hidden chars / BOM / NBSP)
-        sec_type = re.sub(r"[^A-Z]", "", sec_type_raw.strip().upper())
+        sec_type = _NON_UPPER_RE.sub("", sec_type_raw.strip().upper())
         discussion_title = (sec.get("title") or "").strip() or None
         is_written_section = sec_type in {"WA", "WANA"}
         html = sec.get("content", "") or ""
@@ -242,10 +379,18 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
 
         if not html:
             continue
-        soup = BeautifulSoup(html, "html.parser")
-
-        for tag in soup.find_all(["p","h6","h5","h4","h3","h2","h1"]):
-            raw_text = tag.get_text(" ", strip=True)
+        try:
+            root = _section_root(html)
+        except etree.ParserError:
+            continue  # whitespace / comments only
+
+        # Paragraphs carrying a <strong> speaker label, found in one query rather
+        # than a descendant search per paragraph. Iteration below stays in
+        # document order (Chair markers and continuations depend on it).
+        labelled_paras = set(root.xpath("//p[.//strong]"))
+
+        for tag in root.iter(*_SPEECH_TAGS):
+            raw_text = _tag_text(tag)
             text = strip_question_number(raw_text)
             if not text:
                 continue
@@ -255,22 +400,23 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
                 current_chair = cm
                 continue
 
-            if tag.name == "h6" and re.match(r"^\d{1,2}\.\d{2}\s*(am|pm)$", text, flags=re.I):
-                continue
-            if tag.name != "p":
+            # Headings (including h6 time stamps like "10.30 am") only matter as
+            # Chair markers, so no separate time-stamp test is needed
+            if tag.tag != "p":
                 continue
 
-            strong = tag.find("strong")
-            if strong:
+            if tag in labelled_paras:
                 full_raw = raw_text
                 full = text
 
                 # Speaker labels sometimes have split <strong> tags (e.g. '<strong>Mr </strong><strong>Ong Ye Kung</strong>:').
                 # Use the visible text up to the first ':' as the speaker label when available.
-                if ":" in full:
-                    speaker_raw = full.split(":", 1)[0].strip()
+                # Partitioned once; the colon test and the speech text below reuse it.
+                label, colon, after_colon = full.partition(":")
+                if colon:
+                    speaker_raw = label.strip()
                 else:
-                    speaker_raw = strong.get_text(" ", strip=True)
+                    speaker_raw = _tag_text(tag.find(".//strong"))
 
                 speaker_raw = (speaker_raw or "").rstrip(":").strip()
 
@@ -281,29 +427,21 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
                 # Non-spoken Question Time question listings like:
                 #   '13 Mr X asked the Minister ...'
                 # We want to keep these rows for metadata, but mark them as non-oral-speech.
-                if ":" not in full and is_question_paper_item(speaker_raw, full_raw):
+                if not colon and is_question_paper_item(speaker_raw, full_raw):
                     out_speaker_raw = speaker_raw
                     out_mp_fuzzy = canonicalize_to_attendance(clean_mp_name_from_attendance(speaker_raw) or speaker_raw)
-                    out_dim_speaker = None if is_written_section else chair_role(current_chair)
-                    out_chair_name = None if is_written_section else chair_display_name(current_chair)
-                    row_num += 1
-                    speech_rows.append({
-                        "sitting_date": sitting_date,
-                        "parliament_no": parliament_no,
-                        "row_num": row_num,
-                        "discussion_title": discussion_title,
-                        "section_type": sec_type,
-                        "mp_name_raw": out_speaker_raw,
-                        "mp_name_fuzzy_matched": out_mp_fuzzy,
-                        "speech_details": full,
-                        "word_count": word_count(full),
-                        "dim_speaker": out_dim_speaker,
-                        "chair_name_raw": out_chair_name,
-                        "dim_is_question_for_oral_answer": 1 if sec_type == "OA" else 0,
-                        "dim_is_oral_speech": 0,
-                        "dim_is_written_answer_not_answered": dim_is_written_answer_not_answered,
-                        "dim_is_written_answer_to_questions": dim_is_written_answer_to_questions,
-                    })
+                    chair_dim, chair_name, _ = chair_info(current_chair)
+                    out_dim_speaker = None if is_written_section else chair_dim
+                    out_chair_name = None if is_written_section else chair_name
+                    add_speech_row(
+                        mp_name_raw=out_speaker_raw,
+                        mp_name_fuzzy_matched=out_mp_fuzzy,
+                        speech_details=full,
+                        dim_speaker=out_dim_speaker,
+                        chair_name_raw=out_chair_name,
+                        dim_is_question_for_oral_answer=1 if sec_type == "OA" else 0,
+                        dim_is_oral_speech=0,
+                    )
                     continue
 
                 inferred = infer_chair_from_speaker_label(speaker_raw)
@@ -318,10 +456,14 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
                         current_chair = inferred
 
                 # Prefer splitting speech at first colon for robustness
-                if ":" in full:
-                    speech = full.split(":", 1)[1].strip()
+                if colon:
+                    speech = after_colon.strip()
                 else:
-                    speech = re.sub(r"^\s*%s\s*" % re.escape(speaker_raw), "", full).lstrip(" :").strip()
+                    # speaker_raw is stripped, so a plain prefix test matches
+                    # the old ^\s*<label>\s* substitution exactly
+                    rest = full.lstrip()
+                    rest = rest[len(speaker_raw):].lstrip() if rest.startswith(speaker_raw) else full
+                    speech = rest.lstrip(" :").strip()
 
                 speech = strip_trailing_chair_call(speech).strip()
                 if not speech:
@@ -335,60 +477,30 @@ def parse_one_sitting(data: dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
 
                 if role_as_speaker is not None:
                     # Chair speaking: map to whoever is currently in the Chair
-                    mp_fuzzy = canonicalize_to_attendance(chair_display_name(current_chair))
+                    mp_fuzzy = chair_info(current_chair)[2]
                 else:
-                    # Non-Chair: speaker_raw may be a role title with the person in parentheses.
-                    # Prefer extracting the actual person name for matching.
-                    extracted_person = extract_person_from_name(speaker_raw) or extract_last_parenthesized_text(speaker_raw)
-                    q_clean = extracted_person or clean_mp_name_from_attendance(speaker_raw) or speaker_raw
-
-                    q_norm = norm_for_match(q_clean)
-                    if q_norm and q_norm in attendance_norm_to_clean:
-                        mp_fuzzy = canonicalize_to_attendance(attendance_norm_to_clean[q_norm])
-                    else:
-                        best, score = best_fuzzy_match(q_clean, attendance_choices_clean)
-                        # Slightly looser threshold to reduce false negatives for older Hansards
-                        mp_fuzzy = canonicalize_to_attendance(best) if score >= 0.75 else None
-                out_dim_speaker = None if is_written_section else chair_role(current_chair)
-                out_chair_name = None if is_written_section else chair_display_name(current_chair)
+                    mp_fuzzy = match_speaker(speaker_raw)
+                chair_dim, chair_name, _ = chair_info(current_chair)
+                out_dim_speaker = None if is_written_section else chair_dim
+                out_chair_name = None if is_written_section else chair_name
 
-                row_num += 1
                 dim_is_oral_speech = 0 if (dim_is_written_answer_to_questions or dim_is_written_answer_not_answered) else 1
-                speech_rows.append({
-                    "sitting_date": sitting_date,
-                    "parliament_no": parliament_no,
-                    "row_num": row_num,
-                    "discussion_title": discussion_title,
-                    "section_type": sec_type,
-                    "mp_name_raw": speaker_raw,
-                    "mp_name_fuzzy_matched": mp_fuzzy,
-                    "speech_details": speech,
-                    "word_count": word_count(speech),
-                    "dim_speaker": out_dim_speaker,
-                    "chair_name_raw": out_chair_name,
-                    "dim_is_question_for_oral_answer": 0,
-                    "dim_is_oral_speech": dim_is_oral_speech,
-                    "dim_is_written_answer_not_answered": dim_is_written_answer_not_answered,
-                    "dim_is_written_answer_to_questions": dim_is_written_answer_to_questions,
-                })
+                add_speech_row(
+                    mp_name_raw=speaker_raw,
+                    mp_name_fuzzy_matched=mp_fuzzy,
+                    speech_details=speech,
+                    dim_speaker=out_dim_speaker,
+                    chair_name_raw=out_chair_name,
+                    dim_is_question_for_oral_answer=0,
+                    dim_is_oral_speech=dim_is_oral_speech,
+                )
             else:
                 append_continuation(text)
 
-    if speech_rows:
-        df_speech = pd.DataFrame(speech_rows)[[
-            "parliament_no","sitting_date","row_num","discussion_title","section_type",
-            "mp_name_raw","mp_name_fuzzy_matched","speech_details","word_count",
-            "dim_speaker","chair_name_raw",
-            "dim_is_question_for_oral_answer","dim_is_oral_speech",
-            "dim_is_written_answer_not_answered","dim_is_written_answer_to_questions",
-        ]]
+    flush_speech_parts()
+    if row_num:
+        df_speech = pd.DataFrame(speech_cols)
     else:
-        df_speech = pd.DataFrame(columns=[
-            "parliament_no","sitting_date","row_num","discussion_title","section_type",
-            "mp_name_raw","mp_name_fuzzy_matched","speech_details","word_count",
-            "dim_speaker","chair_name_raw",
-            "dim_is_question_for_oral_answer","dim_is_oral_speech",
-            "dim_is_written_answer_not_answered","dim_is_written_answer_to_questions",
-        ])
+        df_speech = pd.DataFrame(columns=_SPEECH_COLUMNS)
 
     return df_att, df_ptba, df_speech, source_url, parliament_no, sitting_dt
@@ -0,0 +1,94 @@
+"""Collect finished OpenAI Batch API jobs for per-speech summaries.
+
+Companion to ``AI_BATCH=true`` ingests, run on its own schedule:
+
+    python -m hansard_ingest.reap_summary_batches
+
+Polls every open job in ``hansard_speech_summary_jobs``. For completed
+jobs it downloads the output file, validates each line and writes the
+summary columns back onto ``hansard_speeches``. Lines that fail
+validation are left unsummarised, so ``scripts/backfill_summaries.py``
+(or a later batch) picks them up.
+"""
+
+from datetime import datetime
+
+from .ai_speech_summary import (
+    BATCH_TERMINAL_STATUSES,
+    build_summary_update,
+    get_batch,
+    iter_batch_results,
+    parse_batch_custom_id,
+)
+from .config import AI_DRY_RUN, AI_ENABLED, SCRIPT_VERSION, SKIP_DB
+from .db import Client, supabase_client, write_summary_updates
+
+
+def reap(sb: Client) -> None:
+    resp = (
+        sb.table("hansard_speech_summary_jobs")
+        .select("batch_id,sitting_date,status")
+        .order("created_at")
+        .execute()
+    )
+    jobs = [j for j in resp.data or [] if (j.get("status") or "") not in BATCH_TERMINAL_STATUSES]
+    print(f"Reap speech summary batches: {len(jobs)} open jobs (ver={SCRIPT_VERSION})")
+
+    for job in jobs:
+        batch_id = job["batch_id"]
+        try:
+            batch = get_batch(batch_id)
+        except Exception as e:
+            print(f"Batch status failed for {batch_id}: {e}")
+            continue
+
+        status = batch.get("status") or ""
+        now_iso = datetime.utcnow().isoformat()
+        written = 0
+        failed = 0
+        if status == "completed" and batch.get("output_file_id"):
+            updates = []
+            try:
+                for custom_id, summary in iter_batch_results(batch["output_file_id"]):
+                    key = parse_batch_custom_id(custom_id)
+                    if key is None or not summary:
+                        failed += 1
+                        continue
+                    sitting_iso, row_num, text_hash = key
+                    updates.append({
+                        "sitting_date": sitting_iso,
+                        "row_num": row_num,
+                        **build_summary_update(summary, now_iso=now_iso, text_hash=text_hash),
+                    })
+            except Exception as e:
+                # Leave the job open so the next run retries the download
+                print(f"Batch output failed for {batch_id}: {e}")
+                continue
+            write_summary_updates(sb, updates, f"batch {batch_id}")
+            written = len(updates)
+
+        if status != job.get("status"):
+            try:
+                (
+                    sb.table("hansard_speech_summary_jobs")
+                    .update({"status": status, "updated_at": now_iso})
+                    .eq("batch_id", batch_id)
+                    .execute()
+                )
+            except Exception as e:
+                print(f"Job status update failed for {batch_id}: {e}")
+
+        print(f"Batch {batch_id} ({job.get('sitting_date')}): status={status} written={written} failed={failed}")
+
+
+def main() -> None:
+    if SKIP_DB:
+        raise RuntimeError("SKIP_DB=true; set SKIP_DB=false to reap summary batches.")
+    if not AI_ENABLED or AI_DRY_RUN:
+        print("AI summarization disabled (AI_ENABLED=false or AI_DRY_RUN=true); exiting.")
+        return
+    reap(supabase_client())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """Small helpers: whitespace, date parsing, JSON-safe records, debug I/O."""
 
+import calendar
 import csv
+import functools
 import json
 import math
 import numbers
@@ -8,25 +10,46 @@ import re
 from datetime import date, datetime
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import DEBUG, SAVE_JSON
 
+# orjson is optional: it decodes several times faster than the stdlib and
+# takes response bytes directly. Falls back to json when not installed.
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None  # type: ignore
+
+_WORD_RE = re.compile(r"\b\w+\b")
+_YEAR_RE = re.compile(r"(19\d{2}|20\d{2})")
+# str.translate table for word_count's ASCII path: every non-word character
+# becomes a space, so split() yields exactly the \w+ runs.
+_ASCII_NON_WORD_TO_SPACE = {c: " " for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+
 
 def normalize_ws(s: str) -> str:
     """Normalize whitespace to reduce invisible-difference dupes (NBSP, multiple spaces)."""
     if s is None:
         return ""
-    x = str(s).replace("\u00a0", " ")
-    x = re.sub(r"\s+", " ", x)
-    return x.strip()
+    x = str(s)
+    # Every str.split() separator other than " " (tabs, NBSP, ...) is
+    # non-printable, so already-clean strings are returned without rebuilding
+    if x.isprintable() and "  " not in x and x[:1] != " " and x[-1:] != " ":
+        return x
+    return " ".join(x.split())  # NBSP is whitespace to str.split
 
 
-def normalize_df_pk_cols(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
-    """Normalize PK columns in-place-safe copy (strip + collapse ws) for de-dup/upsert."""
+def normalize_df_pk_cols(df: pd.DataFrame, cols: List[str], inplace: bool = False) -> pd.DataFrame:
+    """Normalize PK columns (strip + collapse ws) for de-dup/upsert.
+
+    Works on a copy unless ``inplace``, for callers that own ``df`` and
+    discard the un-normalized frame anyway.
+    """
     if df is None or df.empty:
         return df
-    out = df.copy()
+    out = df if inplace else df.copy()
     for c in cols:
         if c in out.columns:
             out[c] = out[c].astype(str).map(normalize_ws)
@@ -34,10 +57,17 @@ def normalize_df_pk_cols(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
 
 
 def word_count(text: str) -> int:
-    return len(re.findall(r"\b\w+\b", text or ""))
+    text = text or ""
+    if text.isascii():
+        return len(text.translate(_ASCII_NON_WORD_TO_SPACE).split())
+    return len(_WORD_RE.findall(text))
 
 
 def parse_sitting_date(s: str) -> date:
+    # The API always sends zero-padded DD-MM-YYYY; anything else goes through
+    # strptime so its accepted forms and errors are unchanged.
+    if len(s) == 10 and s[2] == "-" and s[5] == "-" and (s[:2] + s[3:5] + s[6:]).isdigit() and s.isascii():
+        return date(int(s[6:]), int(s[3:5]), int(s[:2]))
     return datetime.strptime(s, "%d-%m-%Y").date()
 
 
@@ -54,17 +84,45 @@ def parse_run_date(s: str) -> Optional[date]:
     return None
 
 
+# Month names/abbreviations as strptime's %B/%b match them (lower-cased)
+_MONTHS = {
+    **{calendar.month_abbr[i].lower(): i for i in range(1, 13)},
+    **{calendar.month_name[i].lower(): i for i in range(1, 13)},
+}
+
+
+def _is_strptime_day(s: str) -> bool:
+    if len(s) == 1:
+        return s in "123456789"
+    if len(s) != 2:
+        return False
+    a, b = s
+    return (a in "12" and b.isdecimal()) or (a == "3" and b in "01") or (a == "0" and b in "123456789")
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_day_month(text: str, year: int) -> Optional[date]:
+    """Parse a PTBA "7 Jan" / "20 December" bound into a date in ``year``.
+
+    Cached: the same handful of bounds recur across rows and sittings.
+    """
     if not text:
         return None
-    t = re.sub(r"\s+", " ", str(text).strip())
-    for fmt in ("%d %b", "%d %B"):
-        try:
-            dt = datetime.strptime(t, fmt).date()
-            return date(year, dt.month, dt.day)
-        except ValueError:
-            continue
-    return None
+    parts = str(text).split()
+    if len(parts) != 2:
+        return None
+    day_s, month_s = parts
+    month = _MONTHS.get(month_s.lower())
+    # Same day forms strptime's %d accepts: 1-9, 01-09, 10-29, 30, 31
+    if month is None or not _is_strptime_day(day_s):
+        return None
+    day = int(day_s)
+    if month == 2 and day == 29:
+        return None  # strptime validates against its default year, 1900
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
 
 
 def extract_year(value: object, fallback: int) -> int:
@@ -80,7 +138,7 @@ def extract_year(value: object, fallback: int) -> int:
     s = str(value).strip()
     if not s:
         return fallback
-    m = re.search(r"(19\d{2}|20\d{2})", s)
+    m = _YEAR_RE.search(s)
     return int(m.group(1)) if m else fallback
 
 
@@ -90,6 +148,14 @@ def ddmmyyyy_from_date(d: date) -> str:
 
 # ---------- Output helpers ----------
 
+def json_loads(data):
+    """Decode JSON from str or bytes. Raises json.JSONDecodeError on bad input
+    (orjson's error type subclasses it)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def maybe_write_csv(df: pd.DataFrame, path: str):
     if not DEBUG:
         return
@@ -99,6 +165,10 @@ def maybe_write_csv(df: pd.DataFrame, path: str):
 def maybe_write_json(data: dict, path: str):
     if not (DEBUG and SAVE_JSON):
         return
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -123,3 +193,37 @@ def scrub_records_for_json(records: List[dict]) -> List[dict]:
             out[k] = v
         cleaned.append(out)
     return cleaned
+
+
+_INFINITIES = (np.inf, -np.inf)
+
+
+def df_to_json_records(df: Optional[pd.DataFrame]) -> List[dict]:
+    """Frame -> list of JSON-safe dicts; same output as scrub_records_for_json(df.to_dict("records")).
+
+    The NaN/Inf/NaT scrub runs once per column instead of once per cell.
+    Object columns are checked for infinities too (e.g. a float mixed in
+    with strings), which ``notna`` alone would let through.
+    """
+    if df is None or df.empty:
+        return []
+    float_cols = df.select_dtypes(include="floating").columns
+    inf_obj_cols = [c for c in df.select_dtypes(include="object").columns if df[c].isin(_INFINITIES).any()]
+    if len(float_cols) or inf_obj_cols:
+        df = df.copy()
+        if len(float_cols):
+            df[float_cols] = df[float_cols].replace(list(_INFINITIES), np.nan)
+        for c in inf_obj_cols:
+            df[c] = df[c].mask(df[c].isin(_INFINITIES))
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def iter_json_record_batches(df: Optional[pd.DataFrame], n: int):
+    """Yield ``df_to_json_records`` for successive ``n``-row slices of ``df``.
+
+    Only one batch of row dicts exists at a time instead of the whole frame's.
+    """
+    if df is None or df.empty:
+        return
+    for i in range(0, len(df), n):
+        yield df_to_json_records(df.iloc[i : i + n])
@@ -6,14 +6,21 @@ date window. Reads dates from Supabase rather than the API, so it only
 touches sittings the system already knows about.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 
 from hansard_ingest.ai_summary import generate_ai_summary
-from hansard_ingest.config import AI_DRY_RUN, AI_ENABLED, DEBUG, SAVE_JSON, SKIP_DB, SCRIPT_VERSION
-from hansard_ingest.db import supabase_client, upsert_all
-from hansard_ingest.fetch import fetch_hansard_json
+from hansard_ingest.config import (
+    AI_DRY_RUN,
+    AI_ENABLED,
+    DEBUG,
+    SAVE_JSON,
+    SKIP_DB,
+    SCRIPT_VERSION,
+)
+from hansard_ingest.db import Client, supabase_client, upsert_all
+from hansard_ingest.main import run_fetched_days
 from hansard_ingest.parse import parse_one_sitting
-from hansard_ingest.utils import ddmmyyyy_from_date, maybe_write_csv, maybe_write_json
+from hansard_ingest.utils import maybe_write_csv, maybe_write_json
 
 
 def main() -> None:
@@ -27,53 +34,48 @@ def main() -> None:
 
     print(f"Backfill sittings: {len(dates)} dates (ver={SCRIPT_VERSION})")
 
+    days = []
     for sitting_iso in dates:
         try:
-            d = datetime.fromisoformat(sitting_iso).date()
+            days.append(datetime.fromisoformat(sitting_iso).date())
         except ValueError:
             print(f"Skip invalid sitting_date: {sitting_iso}")
-            continue
 
-        ddmmyyyy = ddmmyyyy_from_date(d)
+    run_fetched_days(days, lambda d, ddmmyyyy, data: _backfill_day(sb, d, ddmmyyyy, data))
 
-        try:
-            data = fetch_hansard_json(ddmmyyyy)
-        except Exception as e:
-            print(f"Fetch failed for {ddmmyyyy}: {e}")
-            continue
 
-        if DEBUG and SAVE_JSON:
-            maybe_write_json(data, f"hansard_{ddmmyyyy}.json")
+def _backfill_day(sb: Client, d: date, ddmmyyyy: str, data: dict) -> None:
+    if DEBUG and SAVE_JSON:
+        maybe_write_json(data, f"hansard_{ddmmyyyy}.json")
 
-        try:
-            df_att, df_ptba, df_speech, source_url, parliament_no, sitting_dt = parse_one_sitting(data)
-        except Exception as e:
-            print(f"Parse failed for {ddmmyyyy}: {e}")
-            continue
-
-        ai_row = None
-        if AI_ENABLED:
-            try:
-                ai_row = generate_ai_summary(d.isoformat(), df_speech)
-                if AI_DRY_RUN:
-                    ai_row = None
-            except Exception as e:
-                print(f"AI summary failed for {ddmmyyyy}: {e}")
-
-        if DEBUG:
-            maybe_write_csv(df_att, f"attendance_list_{ddmmyyyy}.csv")
-            maybe_write_csv(df_ptba, f"ptba_list_{ddmmyyyy}.csv")
-            maybe_write_csv(df_speech, f"speech_list_{ddmmyyyy}.csv")
-
-        if len(df_att) == 0 and len(df_speech) == 0:
-            print(f"No sitting detected for {ddmmyyyy}; skipping insert")
-            continue
+    try:
+        df_att, df_ptba, df_speech, source_url, parliament_no, sitting_dt = parse_one_sitting(data)
+    except Exception as e:
+        print(f"Parse failed for {ddmmyyyy}: {e}")
+        return
 
+    # A dry run would discard the summary unprinted, so skip the API call
+    ai_row = None
+    if AI_ENABLED and not AI_DRY_RUN:
         try:
-            upsert_all(sb, df_att, df_ptba, df_speech, d.isoformat(), source_url, ai_summary_row=ai_row)
-            print(f"Inserted {ddmmyyyy}: att={len(df_att)} ptba={len(df_ptba)} speech={len(df_speech)}")
+            ai_row = generate_ai_summary(d.isoformat(), df_speech)
         except Exception as e:
-            print(f"DB insert failed for {ddmmyyyy}: {e}")
+            print(f"AI summary failed for {ddmmyyyy}: {e}")
+
+    if DEBUG:
+        maybe_write_csv(df_att, f"attendance_list_{ddmmyyyy}.csv")
+        maybe_write_csv(df_ptba, f"ptba_list_{ddmmyyyy}.csv")
+        maybe_write_csv(df_speech, f"speech_list_{ddmmyyyy}.csv")
+
+    if len(df_att) == 0 and len(df_speech) == 0:
+        print(f"No sitting detected for {ddmmyyyy}; skipping insert")
+        return
+
+    try:
+        upsert_all(sb, df_att, df_ptba, df_speech, d.isoformat(), source_url, ai_summary_row=ai_row)
+        print(f"Inserted {ddmmyyyy}: att={len(df_att)} ptba={len(df_ptba)} speech={len(df_speech)}")
+    except Exception as e:
+        print(f"DB insert failed for {ddmmyyyy}: {e}")
 
 
 if __name__ == "__main__":
@@ -15,15 +15,17 @@ import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import Optional, Tuple
 
 from hansard_ingest.ai_speech_summary import (
     build_summary_update,
     infer_role_from_label,
     needs_summary,
+    speech_hash,
     summarize_row,
 )
 from hansard_ingest.config import AI_DRY_RUN, AI_ENABLED, DEBUG, SKIP_DB, SCRIPT_VERSION
-from hansard_ingest.db import supabase_client
+from hansard_ingest.db import speech_hash_column_available, supabase_client, write_summary_updates
 
 
 def _parse_args() -> argparse.Namespace:
@@ -49,14 +51,18 @@ def _print_progress(processed: int, succeeded: int, failed: int, skipped: int) -
     print(f"\rProgress: processed={processed} succeeded={succeeded} failed={failed} skipped={skipped}", end="", flush=True)
 
 
-def _process_row(row: dict, sb) -> str:
-    """Returns 'succeeded', 'skipped', or 'failed'."""
-    if not needs_summary(row.get("one_liner"), row.get("summary_version")):
-        return "skipped"
-    if not row.get("sitting_date") or row.get("row_num") is None:
-        return "skipped"
+def _process_row(row: dict, now_iso: str) -> Tuple[str, Optional[dict]]:
+    """Returns ('succeeded', update) or ('skipped' | 'failed', None).
 
+    ``update`` carries the speeches PK plus the summary columns; the caller
+    writes a page's updates together with ``write_summary_updates``.
+    """
     speech = str(row.get("speech_details") or "")
+    if not needs_summary(row.get("one_liner"), row.get("summary_version"), row.get("speech_hash"), speech_hash(speech)):
+        return "skipped", None
+    if not row.get("sitting_date") or row.get("row_num") is None:
+        return "skipped", None
+
     speaker_label = row.get("mp_name_raw") or ""
     metadata = {
         "speaker_name": speaker_label,
@@ -67,24 +73,17 @@ def _process_row(row: dict, sb) -> str:
     try:
         summary = summarize_row(speech, metadata)
         if not summary:
-            return "skipped"
-        update = build_summary_update(summary)
-        (
-            sb.table("hansard_speeches")
-            .update(update)
-            .eq("sitting_date", row["sitting_date"])
-            .eq("row_num", row["row_num"])
-            .execute()
-        )
-        return "succeeded"
+            return "skipped", None
+        update = build_summary_update(summary, text=speech, now_iso=now_iso)
+        return "succeeded", {"sitting_date": row["sitting_date"], "row_num": row["row_num"], **update}
     except RuntimeError as e:
         if "DAILY_LIMIT_REACHED" in str(e):
             raise  # propagate so the executor can catch and exit cleanly
         print(f"\nSummary failed for {row.get('sitting_date')} row {row.get('row_num')}: {e}")
-        return "failed"
+        return "failed", None
     except Exception as e:
         print(f"\nSummary failed for {row.get('sitting_date')} row {row.get('row_num')}: {e}")
-        return "failed"
+        return "failed", None
 
 
 def main() -> None:
@@ -103,6 +102,9 @@ def main() -> None:
         return
 
     sb = supabase_client()
+    columns = "sitting_date,row_num,speech_details,mp_name_fuzzy_matched,mp_name_raw,dim_speaker,summary_version,one_liner"
+    if speech_hash_column_available(sb):
+        columns += ",speech_hash"
 
     processed = 0
     succeeded = 0
@@ -126,9 +128,7 @@ def main() -> None:
 
         resp = (
             sb.table("hansard_speeches")
-            .select(
-                "sitting_date,row_num,speech_details,mp_name_fuzzy_matched,mp_name_raw,dim_speaker,summary_version,one_liner"
-            )
+            .select(columns)
             .gte("sitting_date", start_date)
             .lte("sitting_date", end_date)
             .order("sitting_date")
@@ -141,18 +141,25 @@ def main() -> None:
         if not rows:
             break
 
+        now_iso = datetime.utcnow().isoformat()
+        # Summaries for this page, written as batched UPDATEs of existing rows
+        # (never inserts) rather than one update round trip per row
+        updates = []
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(_process_row, row, sb): row for row in rows}
+            futures = {executor.submit(_process_row, row, now_iso): row for row in rows}
             for future in as_completed(futures):
                 try:
-                    result = future.result()
+                    result, update = future.result()
                 except RuntimeError as e:
                     if "DAILY_LIMIT_REACHED" in str(e):
+                        write_summary_updates(sb, updates, f"{start_date} -> {end_date}")
                         print(f"\n\nDaily API limit reached. Resume tomorrow with:\n"
                               f"  --start_date {start_date} --end_date {end_date} (script skips already-summarised rows)\n")
                         sys.exit(0)
-                    result = "failed"
+                    result, update = "failed", None
                     print(f"\nUnexpected error: {e}")
+                if update is not None:
+                    updates.append(update)
                 with lock:
                     processed += 1
                     if result == "succeeded":
@@ -167,6 +174,7 @@ def main() -> None:
                 if limit and processed >= limit:
                     break
 
+        write_summary_updates(sb, updates, f"{start_date} -> {end_date}")
         offset += to_fetch
         _print_progress(processed, succeeded, failed, skipped)
 